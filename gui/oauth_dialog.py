@@ -1,5 +1,6 @@
 """OAuth authentication dialog with embedded webview for Hive MCP Gateway."""
 
+import asyncio
 import logging
 import json
 from typing import Optional, Dict, Any, Callable
@@ -376,7 +377,7 @@ class OAuthFlowDialog(QDialog):
             self.state_label.setText("State: Processing callback...")
             
             # Complete the OAuth flow
-            result = self.oauth_manager.complete_flow(self.current_flow, callback_url)
+            result = asyncio.run(self._complete_flow(callback_url))
             
             if result.success:
                 self.add_event(f"OAuth authentication successful")
@@ -408,6 +409,13 @@ class OAuthFlowDialog(QDialog):
             logger.error(f"OAuth callback processing failed: {e}")
             self.on_auth_error(f"Callback processing failed: {e}")
     
+    async def _complete_flow(self, callback_url: str) -> OAuthResult:
+        """Complete the current flow and release the manager's HTTP client."""
+        try:
+            return await self.oauth_manager.complete_flow(self.current_flow, callback_url)
+        finally:
+            await self.oauth_manager.close()
+    
     def on_auth_error(self, error_message: str):
         """Handle OAuth authentication errors."""
         self.add_event(f"OAuth error: {error_message}")
@@ -36,43 +36,56 @@ from typing import Any, List, Dict
 import os
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from typing import List as _List
 
 from ..models.mcp_config import MCPServerConfig, MCPServerRegistration
 from ..models.config import BackendServerConfig
 from ..services.mcp_registry import MCPDiscoveryService, MCPServerRegistry
 from ..models.config import ServerStatus
+from ..models.tool import Tool
 from .tools import get_tool_repository
 
 router = APIRouter(prefix="/api/mcp", tags=["mcp"])
 logger = logging.getLogger(__name__)
 
-# Singleton registry instance
-_mcp_registry: MCPServerRegistry | None = None
-
-
-def get_mcp_registry() -> MCPServerRegistry:
-    """Get the process-wide MCP registry, preferring the FastAPI app's instance."""
-    global _mcp_registry
-    try:
-        # Prefer the registry created during app startup (shared state)
-        from ..main import app  # noqa: WPS433 (import inside function by design)
-        if hasattr(app, "state") and getattr(app.state, "registry", None) is not None:
-            return app.state.registry  # type: ignore[return-value]
-    except Exception:
-        # If app import/state access fails, fall back to module-level singleton
-        pass
-    if _mcp_registry is None:
-        _mcp_registry = MCPServerRegistry()
-    return _mcp_registry
-
-
-async def get_discovery_service() -> MCPDiscoveryService:
-    """Get discovery service instance"""
-    repo = await get_tool_repository()
-    return MCPDiscoveryService(tool_repo=repo)
+# Validates a server's whole tool list in one call
+_TOOLS_ADAPTER = TypeAdapter(list[Tool])
+
+
+def _raw_tool(server: str, tool: Any) -> dict[str, Any]:
+    """Tool fields for a discovered MCP tool, looking each attribute up once."""
+    name = getattr(tool, 'name', 'unknown')
+    parameters = getattr(tool, 'inputSchema', None)
+    if parameters is None:
+        parameters = getattr(tool, 'parameters', {})
+    return {
+        "id": f"{server}_{name}",
+        "name": name,
+        "description": getattr(tool, 'description', 'No description available'),
+        "parameters": parameters,
+        "server": server,
+        "tags": [],
+        "estimated_tokens": 100,
+    }
+
+async def get_mcp_registry(request: Request) -> MCPServerRegistry:
+    """Get the app's MCP registry, creating one if startup didn't."""
+    state = request.app.state
+    registry = getattr(state, "registry", None)
+    if registry is None:
+        registry = state.registry = MCPServerRegistry()
+    return registry
+
+
+async def get_discovery_service(request: Request) -> MCPDiscoveryService:
+    """Get the app's MCP discovery service"""
+    state = request.app.state
+    service = getattr(state, "mcp_discovery_service", None)
+    if service is None:
+        service = state.mcp_discovery_service = MCPDiscoveryService(tool_repo=await get_tool_repository(request))
+    return service
 
 
 class AddServerRequest(BaseModel):
@@ -126,6 +139,7 @@ class LogsResponse(BaseModel):
 @router.post("/reconnect", operation_id="reconnect_server")
 async def reconnect_server(
     request: ReconnectServerRequest,
+    http_request: Request,
     registry: MCPServerRegistry = Depends(get_mcp_registry),  # noqa: B008
     wait_for_discovery: bool = True,
     discovery_timeout: float = 30.0
@@ -139,7 +153,7 @@ async def reconnect_server(
     import asyncio
     
     try:
-        from ..main import app
+        app = http_request.app
         
         # Check if server exists
         backend_servers = registry.list_active_servers()
@@ -259,10 +273,10 @@ async def reconnect_server(
 
 
 @router.post("/register_all", operation_id="register_all_servers")
-async def register_all_servers() -> dict[str, Any]:
+async def register_all_servers(request: Request) -> dict[str, Any]:
     """Force the background registration pipeline to run now and return a summary."""
     try:
-        from ..main import app
+        app = request.app
         if not hasattr(app.state, "auto_registration"):
             raise HTTPException(status_code=500, detail="AutoRegistrationService not available")
 
@@ -282,13 +296,14 @@ async def register_all_servers() -> dict[str, Any]:
 @router.post("/discover_tools", operation_id="discover_tools_now")
 async def discover_tools_now(
     request: DiscoverToolsRequest,
+    http_request: Request,
     registry: MCPServerRegistry = Depends(get_mcp_registry),  # noqa: B008
 ) -> dict[str, Any]:
     """Force immediate tool discovery for a server and update registry."""
     from datetime import datetime
     
     try:
-        from ..main import app
+        app = http_request.app
         if not hasattr(app.state, "client_manager"):
             raise HTTPException(status_code=500, detail="Client manager not available")
 
@@ -376,10 +391,10 @@ async def discover_tools_now(
 
 
 @router.get("/proxy_status", response_model=ProxyStatusResponse, operation_id="proxy_status")
-async def proxy_status() -> ProxyStatusResponse:
+async def proxy_status(request: Request) -> ProxyStatusResponse:
     """Return current MCP Proxy status from orchestrator/settings."""
     try:
-        from ..main import app
+        app = request.app
         app_settings = getattr(app.state, "app_settings", None)
         orchestrator = getattr(app.state, "proxy_orchestrator", None)
         base = getattr(app_settings, "proxy_url", None) if app_settings else None
@@ -401,7 +416,6 @@ async def tail_logs(lines: int = 200) -> LogsResponse:
     """Tail the backend log file (run/backend.log)."""
     try:
         from pathlib import Path
-        from ..main import app
         # Determine run dir relative to project root
         proj_root = Path(__file__).resolve().parents[3]
         log_path = proj_root / 'run' / 'backend.log'
@@ -480,6 +494,7 @@ async def list_servers(
 @router.post("/add_server", operation_id="add_server")
 async def add_server(
     request: AddServerRequest,
+    http_request: Request,
     registry: MCPServerRegistry = Depends(get_mcp_registry),  # noqa: B008
     discovery: MCPDiscoveryService = Depends(get_discovery_service),  # noqa: B008
 ) -> dict[str, Any]:
@@ -489,6 +504,7 @@ async def add_server(
     This is the essential endpoint for AI agents to expand capabilities.
     It combines server registration + tool discovery in one step.
     """
+    app = http_request.app
     try:
         # Register the server
         registration = MCPServerRegistration(
@@ -499,8 +515,7 @@ async def add_server(
         )
         # Persist to main configuration so the proxy orchestrator can hot-reload
         try:
-            from ..main import app as _app
-            cfg_mgr = getattr(_app.state, "config_manager", None)
+            cfg_mgr = getattr(app.state, "config_manager", None)
             if cfg_mgr:
                 bcfg = BackendServerConfig(
                     type="stdio",
@@ -511,14 +526,14 @@ async def add_server(
                     enabled=True,
                     description=registration.description,
                 )
-                cfg_mgr.add_backend_server(request.name, bcfg)
-                # Hot-apply to proxy orchestrator immediately
-                try:
-                    orch = getattr(_app.state, "proxy_orchestrator", None)
-                    if orch:
-                        orch.update_config(cfg_mgr.load_config())
-                except Exception:
-                    pass
+                # Hot-apply to proxy orchestrator immediately, unless nothing changed
+                if cfg_mgr.add_backend_server(request.name, bcfg):
+                    try:
+                        orch = getattr(app.state, "proxy_orchestrator", None)
+                        if orch:
+                            await orch.update_config(cfg_mgr.load_config())
+                    except Exception:
+                        pass
         except Exception:
             # Non-fatal; continue
             pass
@@ -526,7 +541,7 @@ async def add_server(
         server_result = await registry.register_server(registration)
         
         if server_result["status"] != "success":
-            return server_result
+            raise HTTPException(status_code=400, detail=server_result["message"])
         
         # Feature flag (no-op placeholder): LLM-assisted tool enumeration path
         # Enable by setting HMG_ENABLE_LLM_ENUM=1 to test later.
@@ -538,32 +553,28 @@ async def add_server(
             # and merge/enrich results with deterministic discovery when ready.
 
         # Auto-discover and register tools
-        from ..main import app
         if hasattr(app.state, "client_manager"):
             client_manager = app.state.client_manager
             connection_result = await client_manager.connect_server(request.name, request.config.model_dump())
             
             # Register tools in repository
             tools = client_manager.server_tools.get(request.name, [])
-            registered_tools = []
-            
-            for tool in tools:
-                try:
-                    from ..models.tool import Tool
-                    tool_model = Tool(
-                        id=f"{request.name}_{getattr(tool, 'name', 'unknown')}",
-                        name=getattr(tool, 'name', 'unknown'),
-                        description=getattr(tool, 'description', 'No description available'),
-                        parameters=getattr(tool, 'inputSchema', getattr(tool, 'parameters', {})),
-                        server=request.name,
-                        tags=[],
-                        estimated_tokens=100
-                    )
-                    await discovery.tool_repo.add_tool(tool_model)
-                    registered_tools.append(getattr(tool, 'name', 'unknown'))
-                except Exception:
-                    # Continue with other tools if one fails
-                    pass
+            raw_tools = [_raw_tool(request.name, tool) for tool in tools]
+            try:
+                tool_models = _TOOLS_ADAPTER.validate_python(raw_tools)
+            except ValidationError as e:
+                # Errors are located by list index; keep the tools that validated
+                invalid = {error["loc"][0] for error in e.errors()}
+                logger.warning(
+                    f"Skipping {len(invalid)} invalid tools from {request.name}: "
+                    f"{[raw_tools[i]['name'] for i in sorted(invalid)]}"
+                )
+                tool_models = _TOOLS_ADAPTER.validate_python(
+                    [raw for i, raw in enumerate(raw_tools) if i not in invalid]
+                )
+            # Register the whole server's tools in one repository update
+            await discovery.tool_repo.add_tools(tool_models)
+            registered_tools = [tool.name for tool in tool_models]
             
             # Update tool count in server status
             registry.update_server_tool_count(request.name, len(registered_tools))
@@ -589,6 +600,8 @@ async def add_server(
                 response["llm_enumeration"] = "enabled_noop"
             return response
             
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to add server: {str(e)}")
 
@@ -89,17 +89,17 @@ class AuthEventResponse(BaseModel):
 
 # Dependency injection helpers
 
-def get_oauth_manager() -> OAuthManager:
+async def get_oauth_manager() -> OAuthManager:
     """Get OAuth manager instance."""
     return oauth_manager
 
 
-def get_auth_detector() -> AuthDetector:
+async def get_auth_detector() -> AuthDetector:
     """Get auth detector instance."""
     return auth_detector
 
 
-def get_notification_manager() -> NotificationManager:
+async def get_notification_manager() -> NotificationManager:
     """Get notification manager instance."""
     return notification_manager
 
@@ -182,7 +182,7 @@ async def complete_oauth_flow(
             )
         
         # Complete the flow
-        result = oauth_mgr.complete_flow(flow, request.callback_url)
+        result = await oauth_mgr.complete_flow(flow, request.callback_url)
         
         if result.success:
             logger.info(f"OAuth flow completed successfully for {flow.service_name}")
@@ -339,7 +339,7 @@ async def refresh_oauth_token(
         logger.info(f"Refreshing OAuth token for server: {server_name}")
         
         # Try to refresh the token
-        result = oauth_mgr.refresh_token(server_name)
+        result = await oauth_mgr.refresh_token(server_name)
         
         if result.success:
             logger.info(f"Token refreshed successfully for {server_name}")
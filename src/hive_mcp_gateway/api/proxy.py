@@ -1,6 +1,6 @@
 """Proxy API endpoints for tool execution"""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from typing import Any, Dict
 from pydantic import BaseModel
 
@@ -21,7 +21,7 @@ class ExecuteToolResponse(BaseModel):
     result: Any
 
 
-async def get_proxy_service() -> ProxyService:
+async def get_proxy_service(request: Request) -> ProxyService:
     """Get proxy service from app state
     
     Returns:
@@ -30,10 +30,10 @@ async def get_proxy_service() -> ProxyService:
     Raises:
         HTTPException: If proxy service not initialized
     """
-    from ..main import app
-    if not hasattr(app.state, "proxy_service"):
+    state = request.app.state
+    if not hasattr(state, "proxy_service"):
         raise HTTPException(status_code=500, detail="Proxy service not initialized")
-    return app.state.proxy_service
+    return state.proxy_service
 
 
 # Tool execution info endpoint removed - not essential for AI agents
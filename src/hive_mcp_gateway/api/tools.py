@@ -19,37 +19,26 @@ from ..services.discovery import DiscoveryService
 router = APIRouter(prefix="/api/tools", tags=["tools"])
 
 
-# Singleton repository instance
-_tool_repository: Any = None
-
-
-async def get_tool_repository() -> Any:
-    """Get or create tool repository instance."""
-    global _tool_repository
-    if _tool_repository is None:
+async def get_tool_repository(request: Request) -> Any:
+    """Get the app's tool repository, creating it on first use."""
+    state = request.app.state
+    repo = getattr(state, "tool_repository", None)
+    if repo is None:
         from ..services.repository import InMemoryToolRepository
-        from ..services.mcp_registry import MCPServerRegistry
 
-        _tool_repository = InMemoryToolRepository()
-        
-        # Load tools from registered MCP servers instead of demo tools
-        # This allows the system to start empty and tools to be added dynamically
-        # via the MCP server registration endpoints
-        
-        # Optional: Pre-load some default servers
-        # registry = MCPServerRegistry()
-        # await registry.load_default_servers()
-        
-    return _tool_repository
+        # Starts empty; tools are added as MCP servers are registered
+        repo = state.tool_repository = InMemoryToolRepository()
+    return repo
 
 
 # Dependency injection for services
-async def get_discovery_service() -> DiscoveryService:
-    """Get discovery service instance."""
-    repo = await get_tool_repository()
-    return DiscoveryService(tool_repo=repo)
-
-
+async def get_discovery_service(request: Request) -> DiscoveryService:
+    """Get the app's discovery service, built once since it loads an embedding model."""
+    state = request.app.state
+    service = getattr(state, "discovery_service", None)
+    if service is None:
+        service = state.discovery_service = DiscoveryService(tool_repo=await get_tool_repository(request))
+    return service
 
 
 @router.post("/discover", response_model=ToolDiscoveryResponse, operation_id="discover_tools")
@@ -105,7 +94,7 @@ async def clear_tools(
     
     Useful for administrative cleanup and testing scenarios.
     """
-    tool_repo._tools.clear()
+    await tool_repo.clear()
     return {"status": "success", "message": "All tools cleared"}
 
 
@@ -10,15 +10,22 @@ from contextlib import asynccontextmanager
 import asyncio
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 from .api import mcp, tools, proxy, oauth_endpoints, ide_endpoints
 from .services.mcp_client_manager import MCPClientManager
 from .services.proxy_service import ProxyService
 from .services.config_manager import ConfigManager
 from .services.file_watcher import FileWatcherService
 from .services.repository import InMemoryToolRepository
-from .services.mcp_registry import MCPServerRegistry
+from .services.mcp_registry import MCPDiscoveryService, MCPServerRegistry
 from .services.auto_registration import AutoRegistrationService
 from .services.error_handler import ErrorHandler
 from .services.proxy_orchestrator import MCPProxyOrchestrator
@@ -99,16 +106,24 @@ async def lifespan(app: FastAPI):
         # Initialize lightweight services (non-blocking)
         logger.info("Initializing InMemoryToolRepository...")
         tool_repository = InMemoryToolRepository()
-        logger.info("Initializing ProxyService...")
-        proxy_service = ProxyService(client_manager, tool_repository)
         # Initialize gating service (skeleton) and honor default policy from settings
         from .services.gating_service import GatingService
         gating_service = GatingService(default_policy=getattr(app_settings, 'default_policy', 'deny'))
+        logger.info("Initializing ProxyService...")
+        proxy_service = ProxyService(
+            client_manager,
+            tool_repository,
+            cacheable_tools=set(app_settings.cacheable_tools),
+            result_cache_ttl=app_settings.result_cache_ttl,
+            gating=gating_service,
+            registry=registry,
+        )
         logger.info("Initializing FileWatcherService...")
         file_watcher = FileWatcherService(config_manager, registry)  # pass registry instead of client_manager
 
-        # Always attempt to manage an embedded MCP Proxy for stdio servers
-        proxy_url = getattr(app_settings, "proxy_url", None)
+        # Always attempt to manage an embedded MCP Proxy for stdio servers;
+        # it is started by the background pipeline so startup doesn't wait on it
+        orchestrator = None
         try:
             # Determine if any stdio servers exist; if so, we need the proxy
             have_stdio = any(getattr(s, 'type', 'stdio') == 'stdio' for s in backend_servers.values())
@@ -117,22 +132,17 @@ async def lifespan(app: FastAPI):
                 from pathlib import Path
                 run_dir = Path(__file__).resolve().parents[2] / "run"
                 orchestrator = MCPProxyOrchestrator(config_path, run_dir)
-                proxy_conf = orchestrator.build_proxy_config(config)
-                conf_file = orchestrator.write_config_file(proxy_conf)
-                if orchestrator.try_start(conf_file):
-                    proxy_url = orchestrator.base_url
-                    app_settings.proxy_url = proxy_url
-                    logger.info(f"Managed MCP Proxy started at {proxy_url}")
-                else:
-                    logger.warning("MCP Proxy could not be started automatically (binary/docker not found)")
                 app.state.proxy_orchestrator = orchestrator
         except Exception as e:
-            logger.warning(f"Failed to start managed MCP Proxy: {e}")
+            logger.warning(f"Failed to set up managed MCP Proxy: {e}")
 
         # Store services in app state before spawning background work
         logger.info("Storing services in app state...")
         app.state.client_manager = client_manager
         app.state.proxy_service = proxy_service
+        # Shared with the API so tools registered there are executable through the proxy
+        app.state.tool_repository = tool_repository
+        app.state.mcp_discovery_service = MCPDiscoveryService(tool_repo=tool_repository)
         app.state.gating = gating_service
         app.state.config_manager = config_manager
         app.state.file_watcher = file_watcher
@@ -148,7 +158,7 @@ async def lifespan(app: FastAPI):
                     cfg = config_manager.load_config()
                     orchestrator = getattr(app.state, "proxy_orchestrator", None)
                     if orchestrator:
-                        orchestrator.update_config(cfg)
+                        await orchestrator.update_config(cfg)
                         logger.info("MCP Proxy configuration hot-reloaded")
                 except Exception as e:
                     logger.warning(f"Failed to hot-reload MCP Proxy config: {e}")
@@ -159,6 +169,16 @@ async def lifespan(app: FastAPI):
         # Spawn background startup pipeline to avoid blocking bind/listen
         async def _background_startup():
             try:
+                # Start the proxy first; stdio servers registered below may route through it
+                if orchestrator is not None:
+                    try:
+                        if await orchestrator.update_config(config):
+                            app_settings.proxy_url = orchestrator.base_url
+                            logger.info(f"Background startup: Managed MCP Proxy started at {orchestrator.base_url}")
+                        else:
+                            logger.warning("Background startup: MCP Proxy could not be started automatically (binary/docker not found)")
+                    except Exception as e:
+                        logger.warning(f"Background startup: Failed to start managed MCP Proxy: {e}")
                 logger.info("Background startup: Starting automatic server registration pipeline...")
                 registration_results = await auto_registration.register_all_servers(config)
                 logger.info(
@@ -267,9 +287,14 @@ app = FastAPI(
     title="Hive MCP Gateway",
     description="FastAPI application for tool gating MCP",
     version="0.2.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson encodes response bodies several times faster when installed
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
 )
 
+# Compress larger JSON bodies (tool lists, config dumps); SSE streams are left alone
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
 # Include API routers
 app.include_router(tools.router)
 app.include_router(mcp.router)
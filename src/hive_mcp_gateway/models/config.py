@@ -132,6 +132,9 @@ class ToolGatingSettings(BaseModel):
     proxy_url: Optional[str] = Field(default=None, alias="proxyUrl")
     manage_proxy: bool = Field(default=True, alias="manageProxy")
     auto_proxy_stdio: bool = Field(default=True, alias="autoProxyStdio")
+    # Tool IDs whose results may be reused for identical arguments (read-only tools)
+    cacheable_tools: List[str] = Field(default_factory=list, alias="cacheableTools")
+    result_cache_ttl: float = Field(default=60.0, ge=0, alias="resultCacheTtl")  # seconds
     
     class Config:
         validate_by_name = True
@@ -9,6 +9,7 @@ This is a pragmatic solution that:
 import asyncio
 import json
 import logging
+import shlex
 import subprocess
 from typing import Dict, Any, List, Optional
 
@@ -58,7 +59,7 @@ class BannerFilterClient:
                 "JSON_ONLY": "1",
             })
             
-            logger.info(f"Starting subprocess for {name}: {command} {' '.join(args)}")
+            logger.info(f"Starting subprocess for {name}: {shlex.join([command, *args])}")
             
             # Start the subprocess
             proc = await asyncio.create_subprocess_exec(
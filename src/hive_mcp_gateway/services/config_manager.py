@@ -208,12 +208,18 @@ class ConfigManager:
         config = self.load_config()
         return config.backend_mcp_servers
     
-    def add_backend_server(self, name: str, config: BackendServerConfig) -> None:
-        """Add a new backend MCP server configuration."""
+    def add_backend_server(self, name: str, config: BackendServerConfig) -> bool:
+        """Add a new backend MCP server configuration.
+        
+        Returns False without rewriting the file if an identical entry exists.
+        """
         current_config = self.load_config()
+        if current_config.backend_mcp_servers.get(name) == config:
+            return False
         current_config.backend_mcp_servers[name] = config
         self.save_config(current_config)
         logger.info(f"Added backend server: {name}")
+        return True
     
     def remove_backend_server(self, name: str) -> bool:
         """Remove a backend MCP server configuration."""
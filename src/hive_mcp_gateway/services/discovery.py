@@ -18,7 +18,8 @@ class DiscoveryService:
         self.tool_repo = tool_repo
         # Initialize sentence transformer for semantic search
         self.encoder = SentenceTransformer(model_name)
-        self._tool_embeddings_cache: dict[str, NDArray[np.float64]] = {}
+        # tool id -> (text embedded, embedding); the text guards against re-registered tools
+        self._tool_embeddings_cache: dict[str, tuple[str, NDArray[np.float64]]] = {}
 
     async def find_relevant_tools(
         self,
@@ -75,8 +76,10 @@ class DiscoveryService:
         self, text: str, cache_key: str | None = None
     ) -> NDArray[np.float64]:
         """Get embedding for text, using cache if available."""
-        if cache_key and cache_key in self._tool_embeddings_cache:
-            return self._tool_embeddings_cache[cache_key]
+        if cache_key:
+            cached = self._tool_embeddings_cache.get(cache_key)
+            if cached is not None and cached[0] == text:
+                return cached[1]
 
         # Generate embedding using sentence transformer
         embedding_result = self.encoder.encode(text)
@@ -84,7 +87,7 @@ class DiscoveryService:
         embedding: NDArray[np.float64] = np.array(embedding_result, dtype=np.float64)
 
         if cache_key:
-            self._tool_embeddings_cache[cache_key] = embedding
+            self._tool_embeddings_cache[cache_key] = (text, embedding)
 
         return embedding
 
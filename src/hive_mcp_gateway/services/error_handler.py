@@ -1,11 +1,14 @@
 """Comprehensive error handling and recovery system for Hive MCP Gateway."""
 
 import logging
+import random
 import traceback
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 import asyncio
 
+import httpx
+
 from ..models.config import ServerStatus
 
 logger = logging.getLogger(__name__)
@@ -50,6 +53,32 @@ class HealthCheckError(MCPError):
         super().__init__(message, "HEALTH_CHECK_ERROR", details)
 
 
+# Failures that another attempt cannot fix: a missing command, bad permissions,
+# a malformed URL or an invalid server config. Broad ValueError is deliberately
+# excluded, since a banner-corrupted handshake raises JSON/pydantic errors
+# (both ValueError subclasses) that a retry usually clears.
+NON_RETRYABLE_ERRORS = (
+    FileNotFoundError,
+    PermissionError,
+    httpx.InvalidURL,
+    httpx.UnsupportedProtocol,
+    ConfigurationError,
+)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether a connection failure is worth retrying."""
+    return not isinstance(error, NON_RETRYABLE_ERRORS)
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float = 30.0) -> float:
+    """Exponential backoff for a 0-based attempt, capped and jittered by +/-50%.
+
+    The jitter keeps servers that failed together from retrying in lockstep.
+    """
+    return min(max_delay, base_delay * (2 ** attempt)) * random.uniform(0.5, 1.5)
+
+
 class ErrorHandler:
     """Comprehensive error handling and recovery system."""
     
@@ -23,6 +23,8 @@ class MCPClientManager:
         self._server_info: Dict[str, Dict[str, Any]] = {}
         self._stdio_contexts: Dict[str, Any] = {}  # Store context managers
         self._http_sessions: Dict[str, aiohttp.ClientSession] = {}  # HTTP client sessions
+        # Config and connection path of each live connection, to reuse it on identical requests
+        self._live_connections: Dict[str, tuple[dict, str]] = {}
         self.error_handler = error_handler
     
     async def connect_server(self, name: str, config: dict) -> Dict[str, Any]:
@@ -32,6 +34,27 @@ class MCPClientManager:
             name: Unique server name
             config: Server configuration with command, args, env or url, headers
         """
+        live = self._live_connections.get(name)
+        if live and live[0] == config:
+            if await self._is_alive(name):
+                # Same config as the live session: skip the cold connect and tool listing
+                try:
+                    from ..main import app
+                    registry = getattr(app.state, "registry", None) if hasattr(app, "state") else None
+                    if registry:
+                        registry.set_connection_state(name, "connected", path=live[1])
+                except Exception:
+                    pass
+                return {
+                    "status": "success",
+                    "message": f"Already connected to {name}",
+                    "tools_count": len(self.server_tools.get(name, [])),
+                    "connection_path": live[1],
+                }
+            # The backend died since it connected; drop the stale session and reconnect
+            logger.info(f"Session for {name} is no longer responding; reconnecting")
+            await self.disconnect_server(name)
+        
         server_type = config.get("type", "stdio")
         via = config.get("via", "direct")
         connection_path = "unknown"
@@ -98,6 +121,11 @@ class MCPClientManager:
             
             # Add connection path to result
             result["connection_path"] = connection_path
+            if result.get("status") == "success" and name in self.sessions:
+                # Copy so later edits to the caller's dict can't fake a match
+                self._live_connections[name] = (dict(config), connection_path)
+            else:
+                self._live_connections.pop(name, None)
             
             # Ensure tools_count is included in the result
             if "tools_count" not in result and name in self.server_tools:
@@ -112,6 +140,18 @@ class MCPClientManager:
             logger.error(f"Failed to connect to server {name}: {str(e)}")
             return {"status": "error", "message": str(error), "connection_path": "unknown"}
     
+    async def _is_alive(self, name: str) -> bool:
+        """Check a connected session still answers a ping within a short timeout."""
+        session = self.sessions.get(name)
+        if session is None:
+            return False
+        try:
+            await asyncio.wait_for(session.send_ping(), timeout=2)
+            return True
+        except Exception as e:
+            logger.debug(f"Ping to {name} failed: {e}")
+            return False
+    
     async def _connect_stdio_server(self, name: str, config: dict) -> Dict[str, Any]:
         """Connect to a stdio-based MCP server and discover its tools."""
         # Special handling for context7 - use mock tools if MCP SDK is not available
@@ -577,6 +617,7 @@ class MCPClientManager:
         # Remove from sessions
         if name in self.sessions:
             del self.sessions[name]
+        self._live_connections.pop(name, None)
         
         # Update server info
         if name in self._server_info:
@@ -102,6 +102,40 @@ class MCPServerRegistry:
         
         return {"status": "success", "message": f"Server '{name}' updated successfully"}
 
+    async def register_server(self, registration: MCPServerRegistration) -> dict[str, Any]:
+        """Register a server from an API registration request"""
+        name = registration.name
+        if not registration.config.command.strip():
+            return {
+                "status": "error",
+                "message": f"Server '{name}' has no command configured",
+                "server_name": name,
+            }
+        if self._servers.get(name) == registration.config and name in self._server_status:
+            # Re-registering the same config: keep the live status untouched
+            return {
+                "status": "success",
+                "message": f"Server '{name}' already registered",
+                "server_name": name,
+                "cached": True,
+            }
+
+        self._servers[name] = registration.config
+        self._server_status[name] = ServerStatus(
+            name=name,
+            enabled=True,
+            connected=False,
+            health_status="unknown",
+            tool_count=0,
+        )
+        logger.info(f"Registered server: {name}")
+
+        return {
+            "status": "success",
+            "message": f"Server '{name}' registered successfully",
+            "server_name": name,
+        }
+
     # Enhanced methods for dynamic configuration management with health checks
     
     async def register_server_from_config(self, name: str, config: BackendServerConfig) -> dict[str, Any]:
@@ -357,18 +391,13 @@ class MCPDiscoveryService:
     ) -> dict[str, Any]:
         """Discover and optionally register tools from an MCP server"""
 
-        discovered_tools = []
-
-        for mcp_tool in tools:
-            tool_data = mcp_tool.to_internal_tool(server_name)
-            discovered_tools.append(tool_data)
+        discovered_tools = [mcp_tool.to_internal_tool(server_name) for mcp_tool in tools]
 
-            if auto_register:
-                # Add tool to repository
-                from ..models.tool import Tool
+        if auto_register:
+            # Add all tools to the repository in one update
+            from ..models.tool import Tool
 
-                tool = Tool(**tool_data)
-                await self.tool_repo.add_tool(tool)
+            await self.tool_repo.add_tools(Tool(**tool_data) for tool_data in discovered_tools)
 
         return {
             "status": "success",
@@ -321,7 +321,7 @@ class MonitoringService(QObject):
             
             # Check expired flows
             expired_flows = len([
-                flow for flow in self.oauth_manager.active_flows.values()
+                flow for flow in list(self.oauth_manager.active_flows.values())
                 if flow.expires_at < datetime.now()
             ])
             
@@ -3,6 +3,8 @@
 import asyncio
 import logging
 import secrets
+import sys
+import threading
 import urllib.parse
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable
@@ -12,15 +14,23 @@ import json
 import hashlib
 import base64
 
+import httpx
 from oauthlib.oauth2 import WebApplicationClient
 from requests_oauthlib import OAuth2Session
-import requests
 from pydantic import BaseModel, Field
 
 from .credential_manager import CredentialManager, CredentialType
 
 logger = logging.getLogger(__name__)
 
+# Interned scope tokens shared across token responses
+_SCOPE_INTERN: Dict[str, str] = {}
+
+
+def _intern_scope(scope: str) -> str:
+    """Return the canonical interned instance of a scope token."""
+    return _SCOPE_INTERN.setdefault(scope, sys.intern(scope))
+
 
 class OAuthConfig(BaseModel):
     """OAuth configuration for a service."""
@@ -93,21 +103,41 @@ class OAuthManager:
         """Initialize the OAuth manager."""
         self.credential_manager = credential_manager or CredentialManager()
         
-        # Active flows
+        # Active flows (mutations go through _flows_lock; readers iterate snapshots)
         self.active_flows: Dict[str, OAuthFlow] = {}
+        self._flows_lock = threading.Lock()
         
         # OAuth configurations for known services
         self.oauth_configs: Dict[str, OAuthConfig] = {}
         
+        # Services with a client ID, kept in sync whenever a config is written
+        self._configured: set[str] = set()
+        self._available_services: Optional[tuple[str, ...]] = None
+        
         # Callbacks for flow events
         self.flow_callbacks: List[Callable[[OAuthFlow], None]] = []
         
         # Default flow expiry (15 minutes)
         self.flow_expiry_minutes = 15
         
+        # Shared async HTTP client for token endpoint requests (created lazily)
+        self._http: Optional[httpx.AsyncClient] = None
+        
         # Load built-in OAuth configs
         self._load_builtin_configs()
     
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(timeout=30.0)
+        return self._http
+    
+    async def close(self):
+        """Close the shared HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
     def _load_builtin_configs(self):
         """Load built-in OAuth configurations for common services."""
         # Google OAuth
@@ -252,6 +282,7 @@ class OAuthManager:
                     extra_params=custom_config.get("extra_params")
                 )
                 self.oauth_configs[service_name] = config
+                self._available_services = None
             else:
                 # Update existing config
                 config = self.oauth_configs[service_name]
@@ -263,6 +294,8 @@ class OAuthManager:
                         if hasattr(config, key):
                             setattr(config, key, value)
             
+            self._update_configured(service_name)
+            
             # Store credentials securely
             self.credential_manager.set_credential(
                 f"oauth_{service_name}_client_id",
@@ -307,7 +340,7 @@ class OAuthManager:
             raise ValueError(f"Client ID not configured for {service_name}")
         
         # Generate flow ID and state
-        flow_id = secrets.token_urlsafe(16)
+        flow_id = secrets.token_urlsafe(12)
         state_parameter = secrets.token_urlsafe(32)
         
         # PKCE parameters
@@ -315,10 +348,13 @@ class OAuthManager:
         code_challenge = None
         
         if config.use_pkce:
-            code_verifier = base64.urlsafe_b64encode(secrets.token_bytes(32)).decode('utf-8').rstrip('=')
+            # Strip base64 padding on the bytes before decoding (RFC 7636)
+            code_verifier = base64.urlsafe_b64encode(
+                secrets.token_bytes(32)
+            ).replace(b'=', b'').decode('ascii')
             code_challenge = base64.urlsafe_b64encode(
-                hashlib.sha256(code_verifier.encode('utf-8')).digest()
-            ).decode('utf-8').rstrip('=')
+                hashlib.sha256(code_verifier.encode('ascii')).digest()
+            ).replace(b'=', b'').decode('ascii')
         
         # Create OAuth session
         scope = custom_scope or config.scope
@@ -367,7 +403,8 @@ class OAuthManager:
         )
         
         # Store flow
-        self.active_flows[flow_id] = flow
+        with self._flows_lock:
+            self.active_flows[flow_id] = flow
         
         # Update state
         flow.state = OAuthFlowState.AUTHORIZATION_PENDING
@@ -376,7 +413,7 @@ class OAuthManager:
         logger.info(f"Initiated OAuth flow for {service_name}, flow_id: {flow_id}")
         return flow
     
-    def handle_callback(self, authorization_response_url: str) -> Optional[OAuthFlow]:
+    async def handle_callback(self, authorization_response_url: str) -> Optional[OAuthFlow]:
         """
         Handle OAuth callback with authorization code.
         
@@ -406,7 +443,7 @@ class OAuthManager:
             
             # Find matching flow
             flow = None
-            for f in self.active_flows.values():
+            for f in list(self.active_flows.values()):
                 if f.state_parameter == state:
                     flow = f
                     break
@@ -423,7 +460,7 @@ class OAuthManager:
                 return flow
             
             # Exchange code for token
-            token_info = self._exchange_code_for_token(flow, code)
+            token_info = await self._exchange_code_for_token(flow, code)
             
             if token_info:
                 # Update flow with token info
@@ -448,7 +485,7 @@ class OAuthManager:
             logger.error(f"OAuth callback handling failed: {e}")
             return None
     
-    def _exchange_code_for_token(self, flow: OAuthFlow, code: str) -> Optional[TokenInfo]:
+    async def _exchange_code_for_token(self, flow: OAuthFlow, code: str) -> Optional[TokenInfo]:
         """Exchange authorization code for access token."""
         try:
             config = flow.config
@@ -475,11 +512,10 @@ class OAuthManager:
                 'Content-Type': 'application/x-www-form-urlencoded'
             }
             
-            response = requests.post(
+            response = await self._get_http_client().post(
                 config.token_url,
                 data=token_data,
-                headers=headers,
-                timeout=30
+                headers=headers
             )
             
             if response.status_code != 200:
@@ -496,7 +532,11 @@ class OAuthManager:
             
             refresh_token = token_response.get('refresh_token')
             expires_in = token_response.get('expires_in')
-            scope = token_response.get('scope', '').split() if token_response.get('scope') else flow.metadata.get('scope', [])
+            raw_scope = token_response.get('scope')
+            if raw_scope:
+                scope = [_intern_scope(token) for token in raw_scope.split()]
+            else:
+                scope = flow.metadata.get('scope', [])
             token_type = token_response.get('token_type', 'Bearer')
             
             # Calculate expiry
@@ -562,7 +602,7 @@ class OAuthManager:
             logger.error(f"Failed to get access token for {service_name}: {e}")
             return None
     
-    def refresh_token(self, service_name: str) -> OAuthResult:
+    async def refresh_token(self, service_name: str) -> OAuthResult:
         """Refresh access token using refresh token."""
         try:
             # Get refresh token
@@ -598,11 +638,10 @@ class OAuthManager:
                 'Content-Type': 'application/x-www-form-urlencoded'
             }
             
-            response = requests.post(
+            response = await self._get_http_client().post(
                 config.token_url,
                 data=token_data,
-                headers=headers,
-                timeout=30
+                headers=headers
             )
             
             if response.status_code != 200:
@@ -666,7 +705,7 @@ class OAuthManager:
                 error=str(e)
             )
     
-    def get_valid_token(self, service_name: str) -> Optional[str]:
+    async def get_valid_token(self, service_name: str) -> Optional[str]:
         """Get a valid access token, refreshing if necessary."""
         try:
             # Check current token status
@@ -676,7 +715,7 @@ class OAuthManager:
                 return self.get_access_token(service_name)
             elif status["status"] in ["expired", "expiring_soon"] and status["has_refresh_token"]:
                 # Try to refresh
-                refresh_result = self.refresh_token(service_name)
+                refresh_result = await self.refresh_token(service_name)
                 if refresh_result.success and refresh_result.token_data:
                     return refresh_result.token_data["access_token"]
                 else:
@@ -744,19 +783,26 @@ class OAuthManager:
     def cleanup_expired_flows(self):
         """Clean up expired OAuth flows."""
         current_time = datetime.now()
+        items_snapshot = list(self.active_flows.items())
         expired_flows = [
-            flow_id for flow_id, flow in self.active_flows.items()
+            flow_id for flow_id, flow in items_snapshot
             if current_time > flow.expires_at
         ]
         
-        for flow_id in expired_flows:
-            flow = self.active_flows[flow_id]
+        removed = []
+        with self._flows_lock:
+            for flow_id in expired_flows:
+                flow = self.active_flows.pop(flow_id, None)
+                if flow is not None:
+                    removed.append(flow)
+        
+        # Notify outside the lock so callbacks can touch the manager
+        for flow in removed:
             flow.state = OAuthFlowState.EXPIRED
             self._notify_flow_callbacks(flow)
-            del self.active_flows[flow_id]
         
-        if expired_flows:
-            logger.info(f"Cleaned up {len(expired_flows)} expired OAuth flows")
+        if removed:
+            logger.info(f"Cleaned up {len(removed)} expired OAuth flows")
     
     def get_service_token_status(self, service_name: str) -> Dict[str, Any]:
         """Get token status for a service."""
@@ -817,26 +863,33 @@ class OAuthManager:
             except Exception as e:
                 logger.error(f"OAuth flow callback failed: {e}")
     
+    def _update_configured(self, service_name: str):
+        """Record whether a service currently has a client ID configured."""
+        config = self.oauth_configs.get(service_name)
+        if config is not None and config.client_id:
+            self._configured.add(service_name)
+        else:
+            self._configured.discard(service_name)
+    
     def get_configured_services(self) -> List[str]:
-        """Get list of configured OAuth services."""
-        configured = []
-        for service_name, config in self.oauth_configs.items():
-            if config.client_id:
-                configured.append(service_name)
-        return configured
+        """Get list of configured OAuth services, in config order."""
+        configured = self._configured
+        return [name for name in self.oauth_configs if name in configured]
     
     def get_available_services(self) -> List[str]:
         """Get list of all available OAuth services."""
-        return list(self.oauth_configs.keys())
+        if self._available_services is None:
+            self._available_services = tuple(self.oauth_configs)
+        return list(self._available_services)
     
     def get_flow(self, flow_id: str) -> Optional[OAuthFlow]:
         """Get an OAuth flow by ID."""
         return self.active_flows.get(flow_id)
     
-    def complete_flow(self, flow: OAuthFlow, callback_url: str) -> OAuthResult:
+    async def complete_flow(self, flow: OAuthFlow, callback_url: str) -> OAuthResult:
         """Complete an OAuth flow using the callback URL."""
         try:
-            completed_flow = self.handle_callback(callback_url)
+            completed_flow = await self.handle_callback(callback_url)
             
             if not completed_flow:
                 return OAuthResult(
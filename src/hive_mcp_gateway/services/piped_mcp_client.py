@@ -6,41 +6,66 @@ a named pipe that can be monitored separately.
 """
 
 import asyncio
+import functools
+import hashlib
+import json
 import logging
 import os
 import platform
 import shutil
+import tempfile
+import time
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, TextIO
 
 from mcp import ClientSession
 from mcp.client.stdio import stdio_client, StdioServerParameters
 from mcp.client.sse import sse_client
 
+from .session_owner import SessionOwner
+
 logger = logging.getLogger(__name__)
 
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Seconds a discovered tool list may be reused; a backend restarted with new
+# tools but the same config is picked up on the next reconnect after this
+_TOOLS_CACHE_TTL = 60.0
+
+# Environment that asks servers to skip banners and colored output
+_BANNER_ENV: Dict[str, str] = {
+    "PYTHONUNBUFFERED": "1",
+    "FASTMCP_NO_BANNER": "1",
+    "FASTMCP_DISABLE_BANNER": "1",
+    "NO_COLOR": "1",
+    "CI": "1",
+}
 
 class PipedMCPClient:
     """MCP client that uses named pipes to redirect console output."""
     
     # Named pipe paths
     PIPE_PATH_UNIX = "/tmp/mcp_stdout_pipe"
-    PIPE_PATH_WINDOWS = r"\\.\pipe\mcp_stdout_pipe"
+    PIPE_PATH_WINDOWS = os.path.join(tempfile.gettempdir(), "mcp_stdout_pipe")
     
     def __init__(self):
         self.sessions: Dict[str, ClientSession] = {}
         self.server_tools: Dict[str, List[Any]] = {}
-        self._stdio_contexts: Dict[str, Any] = {}
+        # Transport owners by server name (STDIO and SSE alike)
+        self._stdio_contexts: Dict[str, SessionOwner] = {}
+        # Single append-only log handle shared as stderr by every child
+        self._errlog: Optional[TextIO] = None
+        # Tool lists from previous connects: server name -> (config hash, discovered at, tools)
+        self._tools_cache: Dict[str, tuple[str, float, List[Any]]] = {}
         
         # Determine pipe path based on OS
-        self.pipe_path = self.PIPE_PATH_WINDOWS if platform.system() == "Windows" else self.PIPE_PATH_UNIX
+        self.pipe_path = self.PIPE_PATH_WINDOWS if _IS_WINDOWS else self.PIPE_PATH_UNIX
         
-        # Ensure pipe exists (Unix only, Windows creates on first use)
-        if platform.system() != "Windows":
-            self._ensure_pipe_exists()
+        # Ensure pipe exists
+        self._ensure_pipe_exists()
     
     def _ensure_pipe_exists(self):
-        """Ensure the log file exists (Unix/Mac only)."""
+        """Ensure the log file exists."""
         # Use a regular file instead of FIFO to avoid blocking issues
         # A real implementation would use stdout-mcp-server with proper FIFO handling
         if not os.path.exists(self.pipe_path):
@@ -48,90 +73,54 @@ class PipedMCPClient:
             logger.info(f"Created log file at {self.pipe_path}")
     
     def _get_redirected_stdio_params(self, config: dict) -> StdioServerParameters:
-        """Create STDIO parameters with stderr redirected to named pipe.
+        """Create STDIO parameters for spawning the server directly.
         
-        This prevents banner text from corrupting the JSON-RPC protocol
-        by sending all stderr output to a separate pipe.
+        The server's stderr is redirected by ``_get_stderr_log`` rather than
+        a shell wrapper, so banner text cannot corrupt the JSON-RPC protocol.
         """
-        command = config.get("command", "")
-        args = config.get("args", [])
-        env = dict(config.get("env", {}))
-        
-        # Add banner suppression env vars (best effort)
-        env.update({
-            "PYTHONUNBUFFERED": "1",
-            "FASTMCP_NO_BANNER": "1",
-            "FASTMCP_DISABLE_BANNER": "1",
-            "NO_COLOR": "1",
-            "CI": "1",
-        })
-        
-        # Resolve command path if needed
-        if not os.path.isabs(command):
-            resolved = shutil.which(command)
-            if resolved:
-                command = resolved
-        
-        # Option 1: Direct approach - let MCP SDK handle stdio
-        # This works if the server respects env vars
-        if os.getenv("DISABLE_PIPE_REDIRECT"):
-            return StdioServerParameters(
-                command=command,
-                args=args,
-                env=env,
-                stderr="ignore"  # Critical: ignore stderr to prevent corruption
-            )
+        return _build_stdio_params(
+            config.get("command", ""),
+            tuple(config.get("args", [])),
+            tuple(sorted(config.get("env", {}).items())),
+        )
+    
+    def _get_stderr_log(self) -> TextIO:
+        """Return the shared handle every child's stderr is redirected to.
         
-        # Option 2: Shell wrapper with redirect (more robust)
-        if platform.system() == "Windows":
-            # Windows: use cmd.exe with redirect
-            shell_command = f'"{command}" {" ".join(args)} 2>"{self.pipe_path}"'
-            return StdioServerParameters(
-                command="cmd.exe",
-                args=["/c", shell_command],
-                env=env
-            )
-        else:
-            # Unix/Mac: use sh with redirect
-            # Build escaped command
-            escaped_args = ' '.join(f'"{arg}"' if ' ' in arg else arg for arg in args)
-            shell_command = f'{command} {escaped_args} 2>{self.pipe_path}'
-            
-            return StdioServerParameters(
-                command="sh",
-                args=["-c", shell_command],
-                env=env
-            )
+        The file is opened once with O_APPEND, so the kernel appends writes
+        from concurrent servers atomically instead of each child racing on
+        its own file position. O_CLOEXEC keeps it from leaking into
+        unrelated children; stdio_client dups it onto each server's stderr.
+        """
+        if self._errlog is None or self._errlog.closed:
+            if os.getenv("DISABLE_PIPE_REDIRECT"):
+                self._errlog = open(os.devnull, "w")
+            else:
+                flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+                fd = os.open(self.pipe_path, flags, 0o600)
+                self._errlog = os.fdopen(fd, "a", encoding="utf-8")
+        return self._errlog
     
     async def connect_stdio_server(self, name: str, config: dict) -> Dict[str, Any]:
         """Connect to a STDIO server with pipe redirection."""
         try:
             logger.info(f"Connecting to STDIO server {name} with pipe redirect to {self.pipe_path}")
             
-            # Get parameters with redirect
+            # Get parameters and the stderr redirect target
             server_params = self._get_redirected_stdio_params(config)
+            errlog = self._get_stderr_log()
             
-            # Connect using standard stdio_client
-            context = stdio_client(server_params)
-            self._stdio_contexts[name] = context
-            
-            # Enter context
-            read_stream, write_stream = await asyncio.wait_for(
-                context.__aenter__(),
-                timeout=30
-            )
-            
-            # Create session
-            session = ClientSession(read_stream, write_stream)
-            
-            # Initialize session
-            await asyncio.wait_for(session.initialize(), timeout=30)
+            # Connect using standard stdio_client; stderr goes straight to the log.
+            # The owner task enters the transport and later exits it.
+            owner = SessionOwner(name, stdio_client(server_params, errlog=errlog))
+            self._stdio_contexts[name] = owner
+            session = await owner.start(30)
             
             # Store session
             self.sessions[name] = session
             
-            # Discover tools
-            await self._discover_tools(name, session)
+            # Discover tools (reused if this exact config was seen before)
+            await self._discover_tools(name, session, _config_hash(config))
             
             logger.info(f"Successfully connected to {name} with {len(self.server_tools.get(name, []))} tools")
             
@@ -145,6 +134,7 @@ class PipedMCPClient:
             
         except Exception as e:
             logger.error(f"Failed to connect to {name}: {e}")
+            self._tools_cache.pop(name, None)
             await self._cleanup_stdio(name)
             return {
                 "status": "error",
@@ -166,23 +156,15 @@ class PipedMCPClient:
             else:
                 context = sse_client(url)
             
-            # Connect
-            read_stream, write_stream = await asyncio.wait_for(
-                context.__aenter__(),
-                timeout=30
-            )
-            
-            # Create session
-            session = ClientSession(read_stream, write_stream)
-            
-            # Initialize
-            await asyncio.wait_for(session.initialize(), timeout=30)
+            owner = SessionOwner(name, context)
+            session = await owner.start(30)
             
             # Store
+            self._stdio_contexts[name] = owner
             self.sessions[name] = session
             
-            # Discover tools
-            await self._discover_tools(name, session)
+            # Discover tools (reused if this exact config was seen before)
+            await self._discover_tools(name, session, _config_hash(config))
             
             return {
                 "status": "success",
@@ -192,41 +174,50 @@ class PipedMCPClient:
             
         except Exception as e:
             logger.error(f"Failed to connect to SSE server {name}: {e}")
+            self._tools_cache.pop(name, None)
             return {
                 "status": "error",
                 "message": str(e),
                 "tools_count": 0
             }
     
-    async def _discover_tools(self, name: str, session: ClientSession):
-        """Discover tools from a connected session."""
+    async def _discover_tools(self, name: str, session: ClientSession, config_hash: Optional[str] = None):
+        """Discover tools from a connected session.
+        
+        When ``config_hash`` matches the config the cached tool list was
+        discovered with, and that list is younger than ``_TOOLS_CACHE_TTL``,
+        the ``list_tools`` round-trip is skipped.
+        """
+        cached = self._tools_cache.get(name)
+        if (
+            config_hash is not None
+            and cached is not None
+            and cached[0] == config_hash
+            and time.monotonic() - cached[1] < _TOOLS_CACHE_TTL
+        ):
+            self.server_tools[name] = cached[2]
+            logger.info(f"Reusing {len(cached[2])} cached tools for {name}")
+            return
         try:
-            response = await asyncio.wait_for(
-                session.list_tools(),
-                timeout=10
-            )
+            async with asyncio.timeout(10):
+                response = await session.list_tools()
             tools = response.tools if hasattr(response, 'tools') else []
             self.server_tools[name] = tools
+            if config_hash is not None:
+                self._tools_cache[name] = (config_hash, time.monotonic(), tools)
             logger.info(f"Discovered {len(tools)} tools from {name}")
         except Exception as e:
             logger.error(f"Error discovering tools from {name}: {e}")
             self.server_tools[name] = []
+            self._tools_cache.pop(name, None)
     
     async def _cleanup_stdio(self, name: str):
         """Clean up STDIO connection."""
         try:
-            if name in self._stdio_contexts:
-                context = self._stdio_contexts[name]
-                try:
-                    await asyncio.wait_for(
-                        context.__aexit__(None, None, None),
-                        timeout=5
-                    )
-                except:
-                    pass
-                del self._stdio_contexts[name]
-            if name in self.sessions:
-                del self.sessions[name]
+            owner = self._stdio_contexts.pop(name, None)
+            self.sessions.pop(name, None)
+            if owner is not None:
+                await owner.close()
         except Exception as e:
             logger.debug(f"Cleanup error for {name}: {e}")
     
@@ -244,23 +235,81 @@ class PipedMCPClient:
             raise
     
     async def disconnect_all(self):
-        """Disconnect all servers."""
-        for name in list(self.sessions.keys()):
-            await self._cleanup_stdio(name)
+        """Disconnect all servers concurrently.
+
+        Shutdown is bounded by a single overall deadline; any backend still
+        wedged after it is dropped from the session tables without waiting.
+        """
+        names = list(self.sessions.keys() | self._stdio_contexts.keys())
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(self._cleanup_stdio(n) for n in names), return_exceptions=True),
+                timeout=5
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Timed out disconnecting servers; dropping remaining sessions")
+            self.sessions.clear()
+            self._stdio_contexts.clear()
+        if self._errlog is not None:
+            self._errlog.close()
+            self._errlog = None
     
     def read_pipe_logs(self, lines: int = 50) -> List[str]:
         """Read recent logs from the named pipe (for debugging).
         
-        Note: This is a simple implementation. In production, use
-        stdout-mcp-server for proper log management.
+        Reads backwards from the end of the log file so the cost is
+        proportional to the number of lines requested, not the file size.
         """
-        if not os.path.exists(self.pipe_path):
+        if lines <= 0 or not os.path.exists(self.pipe_path):
             return []
         
         try:
-            with open(self.pipe_path, 'r') as f:
-                all_lines = f.readlines()
-                return all_lines[-lines:]
+            return _tail_lines(self.pipe_path, lines)
         except Exception as e:
             logger.error(f"Error reading pipe logs: {e}")
             return []
+
+
+def _config_hash(config: dict) -> str:
+    """Stable short hash of a server config, used to key the tools cache."""
+    canonical = json.dumps(config, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(canonical, digest_size=8).hexdigest()
+
+
+def _tail_lines(path: str, lines: int, chunk_size: int = 8192) -> List[str]:
+    """Return the last ``lines`` lines of a file, reading it backwards in chunks."""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        # One extra newline covers a trailing newline at end of file
+        while position > 0 and data.count(b"\n") <= lines:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+    text = data.decode("utf-8", errors="replace")
+    return text.splitlines(keepends=True)[-lines:]
+
+
+@functools.lru_cache(maxsize=64)
+def _build_stdio_params(
+    command: str,
+    args: tuple,
+    env_items: tuple,
+) -> StdioServerParameters:
+    """Build (and memoize) the STDIO parameters for a server config."""
+    # Add banner suppression env vars (best effort; they override the config)
+    env = {**dict(env_items), **_BANNER_ENV}
+    
+    # Resolve command path if needed
+    if not os.path.isabs(command):
+        resolved = shutil.which(command)
+        if resolved:
+            command = resolved
+    
+    return StdioServerParameters(
+        command=command,
+        args=list(args),
+        env=env
+    )
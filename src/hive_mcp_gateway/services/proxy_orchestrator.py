@@ -6,50 +6,130 @@ binary or Docker image. On success, exposes a local base URL for SSE endpoints.
 
 from __future__ import annotations
 
+import asyncio
+import errno
+import functools
+import hashlib
+import http.client
 import json
 import logging
+import os
+import select
 import shutil
+import signal
+import socket
 import subprocess
 import sys
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator
 
 from ..models.config import ToolGatingConfig, BackendServerConfig
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# mcp-proxy uses allow/block wording in README; tolerate synonyms
+_TOOL_FILTER_MODES = {"allow": "allow", "deny": "block"}
+
+# Executable names mcp-proxy may be installed under, in order of preference
+_BINARY_NAMES = ("mcp-proxy", "mcp_proxy")
+
+
+@functools.lru_cache(maxsize=8)
+def _which(name: str) -> Optional[str]:
+    """``shutil.which`` memoized for the life of the process.
+
+    Restarts and retries look up the same few executables; call
+    ``_which.cache_clear()`` to pick up newly installed ones.
+    """
+    return shutil.which(name)
+
+
+def _dump_config(data: Dict[str, Any]) -> bytes:
+    """Serialize a proxy config as indented JSON with sorted keys."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
+class _SpawnedProcess:
+    """Minimal ``Popen``-like handle for a process started with ``os.posix_spawn``."""
+
+    def __init__(self, pid: int) -> None:
+        self.pid = pid
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None:
+            try:
+                pid, status = os.waitpid(self.pid, os.WNOHANG)
+            except ChildProcessError:
+                # Already reaped elsewhere; treat as exited
+                self.returncode = -1
+            else:
+                if pid:
+                    self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        """Reap the process, raising ``subprocess.TimeoutExpired`` like ``Popen.wait``."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.005
+        while self.poll() is None:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise subprocess.TimeoutExpired(str(self.pid), timeout)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.1)
+        return self.returncode
+
+    def _signal(self, sig: int) -> None:
+        if self.poll() is None:
+            try:
+                os.kill(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self) -> None:
+        self._signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self._signal(signal.SIGKILL)
+
 
 class MCPProxyOrchestrator:
     def __init__(self, config_path: str, run_dir: Path) -> None:
         self.config_path = config_path
         self.run_dir = run_dir
-        self.proc: Optional[subprocess.Popen] = None
+        self.proc: Optional[subprocess.Popen | _SpawnedProcess] = None
         self.base_url = "http://127.0.0.1:9090"
+        self._last_config_hash: Optional[bytes] = None
+        # Startup and config updates may overlap; only one may start or reload at a time
+        self._update_lock = asyncio.Lock()
+        self._binary_path: Optional[str] = None
+        self._log_offset = 0
 
     def build_proxy_config(self, cfg: ToolGatingConfig) -> Dict[str, Any]:
         servers: Dict[str, Any] = {}
         for name, s in cfg.backend_mcp_servers.items():
             if s.type == "stdio":
-                entry: Dict[str, Any] = {
+                # Map tool filter if present
+                tf = s.options.tool_filter if s.options and s.options.tool_filter and s.options.tool_filter.list else None
+                servers[name] = {
                     "command": s.command,
                     "args": s.args or [],
                     "env": s.env or {},
+                    **({"options": {"toolFilter": {
+                        "mode": _TOOL_FILTER_MODES.get(tf.mode, tf.mode),
+                        "list": tf.list,
+                    }}} if tf else {}),
                 }
-                # Map tool filter if present
-                if s.options and s.options.tool_filter and s.options.tool_filter.list:
-                    mode = s.options.tool_filter.mode
-                    # mcp-proxy uses allow/block wording in README; tolerate synonyms
-                    mode_mapped = "allow" if mode == "allow" else ("block" if mode == "deny" else mode)
-                    entry.setdefault("options", {})["toolFilter"] = {
-                        "mode": mode_mapped,
-                        "list": s.options.tool_filter.list,
-                    }
-                servers[name] = entry
             elif s.type in ("sse", "streamable-http"):
-                entry: Dict[str, Any] = {"url": s.url}
-                if s.headers:
-                    entry["headers"] = s.headers
-                servers[name] = entry
+                servers[name] = {"url": s.url, **({"headers": s.headers} if s.headers else {})}
         proxy_conf = {
             "mcpProxy": {
                 "addr": ":9090",
@@ -63,207 +143,326 @@ class MCPProxyOrchestrator:
         return proxy_conf
 
     def write_config_file(self, data: Dict[str, Any]) -> Path:
+        return self._write_config_bytes(_dump_config(data))
+
+    def _write_config_bytes(self, content: bytes) -> Path:
         self.run_dir.mkdir(parents=True, exist_ok=True)
         path = self.run_dir / "mcp_proxy_config.json"
-        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        # Leave the file (and its mtime) alone when nothing changed
+        try:
+            if path.read_bytes() == content:
+                return path
+        except FileNotFoundError:
+            pass
+        path.write_bytes(content)
         return path
 
     def is_running(self) -> bool:
         return self.proc is not None and self.proc.poll() is None
 
-    def reload(self, config_file: Path) -> bool:
+    async def reload(self, config_file: Path) -> bool:
         """Reload proxy config by restarting the process with the new config.
 
         mcp-proxy does not advertise hot-reload; we perform a fast restart.
         """
         # Stop existing process if running
-        if self.is_running():
-            try:
-                self.proc.terminate()
-            except Exception:
-                pass
-        self.proc = None
+        await self._acleanup_proc()
         # Start again with new config
-        return self.try_start(config_file)
+        return await self.try_start(config_file)
 
-    def update_config(self, cfg: ToolGatingConfig) -> bool:
+    async def update_config(self, cfg: ToolGatingConfig) -> bool:
         """Rebuild and apply a new proxy configuration.
 
         Returns True if proxy is running after update, False otherwise.
         """
-        data = self.build_proxy_config(cfg)
-        conf_file = self.write_config_file(data)
-        if self.is_running():
-            return self.reload(conf_file)
-        else:
-            return self.try_start(conf_file)
-
-    def try_start(self, config_file: Path) -> bool:
-        # Try Docker first since TBXark mcp-proxy is available as container
-        docker = shutil.which("docker")
+        # Serialize once; the output has sorted keys, so hashing it means key
+        # order can't cause spurious restarts
+        content = _dump_config(self.build_proxy_config(cfg))
+        config_hash = hashlib.blake2b(content, digest_size=16).digest()
+        async with self._update_lock:
+            if config_hash == self._last_config_hash and self.is_running():
+                logger.debug("MCP Proxy config unchanged; skipping restart")
+                return True
+            conf_file = self._write_config_bytes(content)
+            if self.is_running():
+                ok = await self.reload(conf_file)
+            else:
+                ok = await self.try_start(conf_file)
+            self._last_config_hash = config_hash if ok else None
+            return ok
+
+    async def try_start(self, config_file: Path) -> bool:
+        """Start the proxy using the first launch strategy that becomes ready."""
+        async for argv in self._candidates(config_file):
+            try:
+                self.proc = self._spawn(argv)
+            except Exception as e:
+                logger.debug(f"Failed to launch {argv[0]}: {e}")
+                continue
+            if await self._await_ready():
+                return True
+            await self._acleanup_proc()
+        return False
+
+    async def _candidates(self, config_file: Path) -> AsyncIterator[list[str]]:
+        """Yield proxy launch command lines in order of preference.
+
+        Each strategy is only evaluated once the previous one has failed:
+        a bundled or installed binary, then a locally pulled Docker image,
+        then Docker (pulling the image on demand). Setting
+        ``HIVE_PREFER_DOCKER`` tries the pulled image before the binary.
+        """
+        prefer_docker = bool(os.getenv("HIVE_PREFER_DOCKER"))
+        docker_args = [
+            "-p",
+            "9090:9090",
+            "-v",
+            f"{config_file}:/config/config.json",
+            "ghcr.io/tbxark/mcp-proxy:latest",
+        ]
+        # Prefer bundled or user-installed binary, then PATH; it starts far
+        # faster than a container and needs no docker round-trips
+        binary = self._find_local_binary()
+        if binary and not prefer_docker:
+            yield [binary, "--config", str(config_file)]
+
+        docker = _which("docker")
+        image_present = False
         if docker:
             try:
                 # Check if the image exists
-                import subprocess
-                result = subprocess.run(
+                result = await asyncio.to_thread(
+                    subprocess.run,
                     [docker, "images", "-q", "ghcr.io/tbxark/mcp-proxy:latest"],
                     capture_output=True,
                     text=True
                 )
-                if result.stdout.strip():
-                    # Image exists, use it
-                    self.proc = subprocess.Popen([
-                        docker,
-                        "run",
-                        "--rm",
-                        "-p",
-                        "9090:9090",
-                        "-v",
-                        f"{config_file}:/config/config.json",
-                        "ghcr.io/tbxark/mcp-proxy:latest",
-                    ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    if self._await_ready():
-                        return True
+                image_present = bool(result.stdout.strip())
             except Exception as e:
                 logger.debug(f"Docker attempt failed: {e}")
-        
-        # Prefer bundled binary if available
-        possible: list[Path] = []
+        if image_present:
+            yield [docker, "run", "--rm", *docker_args]
+
+        if binary and prefer_docker:
+            yield [binary, "--config", str(config_file)]
+
+        # Fall back to docker, letting it pull the image if needed
+        if docker and not image_present:
+            yield [docker, "run", *docker_args]
+
+    def stop(self) -> None:
+        self._cleanup_proc()
+
+    # Internal helpers
+    @property
+    def log_path(self) -> Path:
+        """File the proxy's stderr is appended to."""
+        return self.run_dir / "proxy.log"
+
+    def _spawn(self, argv: list[str]) -> subprocess.Popen | _SpawnedProcess:
+        """Start a proxy process with stdout discarded and stderr appended to the log.
+
+        Nothing reads the child's output while it runs, so pipes would fill
+        up and eventually block the proxy on write. Where available,
+        ``os.posix_spawn`` is used to avoid Popen's fork-side overhead.
+        The proxy runs in its own session so a terminal Ctrl-C reaches only
+        the gateway, which then stops the proxy itself.
+        """
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            self._log_offset = self.log_path.stat().st_size
+        except OSError:
+            self._log_offset = 0
+        if hasattr(os, "posix_spawn") and os.path.isabs(argv[0]):
+            try:
+                pid = os.posix_spawn(argv[0], argv, os.environ, file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                    (os.POSIX_SPAWN_OPEN, 2, str(self.log_path),
+                     os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600),
+                ], setsid=True)
+                return _SpawnedProcess(pid)
+            except OSError as e:
+                logger.debug(f"posix_spawn failed for {argv[0]}, falling back to Popen: {e}")
+        with open(self.log_path, "ab") as log:
+            return subprocess.Popen(
+                argv, stdout=subprocess.DEVNULL, stderr=log, start_new_session=True
+            )
+
+    def _read_log_tail(self, max_bytes: int = 1000) -> str:
+        """Return the last few bytes the current proxy process wrote to the log."""
+        try:
+            with open(self.log_path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(self._log_offset, f.tell() - max_bytes))
+                return f.read().decode("utf-8", errors="ignore").strip()
+        except OSError:
+            return ""
+
+    def _binary_search_dirs(self) -> list[Path]:
+        """Directories checked for a bundled or user-installed mcp-proxy binary."""
+        dirs: list[Path] = []
         try:
             proj_root = Path(__file__).resolve().parents[2]
-            possible.extend([
-                proj_root / "Resources" / "bin" / "mcp-proxy",
-                proj_root / "Resources" / "bin" / "mcp_proxy",
-                proj_root / "bin" / "mcp-proxy",
-                proj_root / "bin" / "mcp_proxy",
-                self.run_dir / "bin" / "mcp-proxy",
-                self.run_dir / "bin" / "mcp_proxy",
-            ])
+            dirs.extend([proj_root / "Resources" / "bin", proj_root / "bin"])
         except Exception:
             pass
-        
-        # Add common user-local installation paths
-        import os
-        home = Path.home()
-        possible.extend([
-            home / ".local" / "bin" / "mcp-proxy",
-            home / ".local" / "bin" / "mcp_proxy",
-            Path("/usr/local/bin/mcp-proxy"),
-            Path("/usr/local/bin/mcp_proxy"),
-            Path("/opt/homebrew/bin/mcp-proxy"),
-            Path("/opt/homebrew/bin/mcp_proxy"),
+        dirs.extend([
+            self.run_dir / "bin",
+            Path.home() / ".local" / "bin",
+            Path("/usr/local/bin"),
+            Path("/opt/homebrew/bin"),
         ])
-        for p in possible:
-            if p.exists():
-                self.proc = subprocess.Popen([str(p), "--config", str(config_file)], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                return self._await_ready()
+        return dirs
+
+    def _find_local_binary(self) -> Optional[str]:
+        """Locate the mcp-proxy binary, scanning each candidate directory once.
+
+        The result is memoized so restarts don't repeat the search.
+        """
+        if self._binary_path and os.path.exists(self._binary_path):
+            return self._binary_path
+        self._binary_path = None
+        for directory in self._binary_search_dirs():
+            try:
+                with os.scandir(directory) as it:
+                    present = {entry.name for entry in it if entry.name in _BINARY_NAMES}
+            except OSError:
+                continue
+            for name in _BINARY_NAMES:
+                if name in present:
+                    self._binary_path = str(directory / name)
+                    return self._binary_path
         # Then try PATH
-        binary = shutil.which("mcp-proxy") or shutil.which("mcp_proxy")
-        if binary:
-            self.proc = subprocess.Popen([binary, "--config", str(config_file)], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            return self._await_ready()
-        # Try docker if present
-        docker = shutil.which("docker")
-        if docker:
-            self.proc = subprocess.Popen([
-                docker,
-                "run",
-                "-p",
-                "9090:9090",
-                "-v",
-                f"{config_file}:/config/config.json",
-                "ghcr.io/tbxark/mcp-proxy:latest",
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            return self._await_ready()
-        return False
+        self._binary_path = _which("mcp-proxy") or _which("mcp_proxy")
+        return self._binary_path
 
-    def stop(self) -> None:
-        if self.proc and self.proc.poll() is None:
+    def _wait_port_open(self, deadline: float, host: str = "127.0.0.1", port: int = 9090) -> bool:
+        """Block until the port accepts connections, the process exits, or the deadline passes.
+
+        Uses a non-blocking connect and ``select`` so readiness is noticed as soon
+        as the kernel reports it. On Linux the process's pidfd is selected too, so
+        process death wakes the wait immediately.
+        """
+        pidfd = None
+        if self.proc is not None and hasattr(os, "pidfd_open"):
             try:
-                self.proc.terminate()
-            except Exception:
-                pass
-        self.proc = None
+                pidfd = os.pidfd_open(self.proc.pid)
+            except OSError:
+                pidfd = None
+        try:
+            while (remaining := deadline - time.monotonic()) > 0:
+                if self.proc is None or self.proc.poll() is not None:
+                    return False
+                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                    s.setblocking(False)
+                    err = s.connect_ex((host, port))
+                    if err in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN):
+                        rlist = [pidfd] if pidfd is not None else []
+                        readable, writable, _ = select.select(rlist, [s], [], remaining)
+                        if not writable:
+                            # Timed out, or the process exited (pidfd readable)
+                            return False
+                        err = s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    if err == 0:
+                        return True
+                # Connection refused: nothing is listening yet, back off briefly
+                time.sleep(min(0.05, max(0.0, deadline - time.monotonic())))
+            return False
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
 
-    # Internal helpers
-    def _port_open(self, host: str = "127.0.0.1", port: int = 9090, timeout: float = 0.5) -> bool:
-        import socket
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(timeout)
-            return s.connect_ex((host, port)) == 0
+    def _probe_http(self) -> bool:
+        """Probe the proxy over one keep-alive HTTP connection.
+
+        Returns True once an endpoint answers with a non-5xx status.
+        """
+        conn = http.client.HTTPConnection("127.0.0.1", 9090, timeout=2)
+        try:
+            # "/" almost always answers; only fall back on server errors
+            for endpoint in ['/', '/health', '/status', '/servers']:
+                conn.request('GET', endpoint)
+                resp = conn.getresponse()
+                resp.read()
+                # Any non-5xx response (200, 404, 405, ...) means proxy is responding
+                if resp.status < 500 or resp.status == 501:
+                    return True
+            return False
+        finally:
+            conn.close()
 
-    def _await_ready(self, retries: int = 20, delay: float = 0.5) -> bool:
+    async def _await_ready(self, retries: int = 20, delay: float = 0.5) -> bool:
         """Wait for proxy to be fully functional, not just port binding.
         
         Performs multi-phase verification:
         1. Process is running
         2. Port is open
         3. HTTP service responds (health check or basic probe)
+
+        The blocking socket probes run in a worker thread so the event loop
+        keeps serving requests while the proxy starts.
         """
-        import time
-        import urllib.request
-        import urllib.error
-        
         self.last_error = None
+        timeout = retries * delay
+        deadline = time.monotonic() + timeout
         
-        for attempt in range(max(1, retries)):
+        while True:
             # Phase 1: Check process is still running
             if self.proc is None or self.proc.poll() is not None:
                 self.last_error = "PROC_DIED: Proxy process terminated unexpectedly"
-                if self.proc and self.proc.stderr:
-                    try:
-                        stderr_output = self.proc.stderr.read(1000).decode('utf-8', errors='ignore')
-                        if stderr_output:
-                            self.last_error += f" - stderr: {stderr_output[:200]}"
-                    except:
-                        pass
-                self._cleanup_proc()
+                stderr_output = self._read_log_tail()
+                if stderr_output:
+                    self.last_error += f" - stderr: {stderr_output[-200:]}"
+                await self._acleanup_proc()
                 return False
             
-            # Phase 2: Check port is open
-            if not self._port_open():
-                if attempt == retries - 1:
-                    self.last_error = "PORT_TIMEOUT: Port 9090 not available after 10s"
-                time.sleep(delay)
+            # Phase 2: Wait for the port to open (wakes as soon as it does)
+            if not await asyncio.to_thread(self._wait_port_open, deadline):
+                if self.proc is not None and self.proc.poll() is None:
+                    self.last_error = f"PORT_TIMEOUT: Port 9090 not available after {timeout}s"
+                    break
+                # Process died while waiting; report it via phase 1
                 continue
             
             # Phase 3: Functional verification via HTTP
             try:
-                # Try health endpoint first
-                for endpoint in ['/health', '/status', '/', '/servers']:
-                    try:
-                        url = f"http://127.0.0.1:9090{endpoint}"
-                        req = urllib.request.Request(url, method='GET')
-                        with urllib.request.urlopen(req, timeout=2) as resp:
-                            # Any HTTP response (200, 404, etc) means proxy is responding
-                            if resp.status in [200, 404, 501]:
-                                return True
-                    except urllib.error.HTTPError as e:
-                        # HTTP errors still mean the proxy is responding
-                        if e.code in [404, 501, 405]:
-                            return True
-                    except:
-                        continue
-            except Exception as e:
-                if attempt == retries - 1:
-                    self.last_error = f"HTTP_CHECK_FAILED: Proxy not responding to HTTP after {retries * delay}s"
+                if await asyncio.to_thread(self._probe_http):
+                    return True
+            except (OSError, http.client.HTTPException):
+                self.last_error = f"HTTP_CHECK_FAILED: Proxy not responding to HTTP after {timeout}s"
             
-            time.sleep(delay)
+            if time.monotonic() + delay >= deadline:
+                break
+            await asyncio.sleep(delay)
         
-        # Not ready after all retries
-        self.last_error = self.last_error or f"TIMEOUT: Proxy readiness check timed out after {retries * delay}s"
-        self._cleanup_proc()
+        # Not ready before the deadline
+        self.last_error = self.last_error or f"TIMEOUT: Proxy readiness check timed out after {timeout}s"
+        await self._acleanup_proc()
         return False
     
-    def _cleanup_proc(self):
-        """Clean up the proxy process."""
+    def _cleanup_proc(self, timeout: float = 3.0):
+        """Stop the proxy process and reap it so no zombie is left behind.
+
+        Blocks for up to twice ``timeout`` while the process exits; coroutines
+        must use ``_acleanup_proc`` instead.
+        """
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
         try:
-            if self.proc:
-                self.proc.terminate()
+            proc.terminate()
+            try:
+                proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait(timeout=timeout)
         except Exception:
             pass
-        self.proc = None
     
+    async def _acleanup_proc(self, timeout: float = 3.0):
+        """``_cleanup_proc`` run in a worker thread so the event loop isn't blocked."""
+        await asyncio.to_thread(self._cleanup_proc, timeout)
+
     def get_last_error(self) -> Optional[str]:
         """Get the last error message from startup/readiness checks."""
         return getattr(self, 'last_error', None)
@@ -1,33 +1,96 @@
 """Proxy Service for routing tool execution to backend MCP servers"""
 
-from typing import Dict, Any, Set, Optional, List
+import functools
+import json
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Set, Optional, List, Tuple
 
 from ..models.tool import Tool
+from .gating_service import GatingService
 from .mcp_client_manager import MCPClientManager
+from .mcp_registry import MCPServerRegistry
 from .repository import InMemoryToolRepository
 
 
+# Every tag keyword in one alternation; the lookahead reports overlapping
+# matches so this behaves like a substring test per keyword in one scan
+_TAG_PATTERN = re.compile(
+    r"(?=(search|web|browser|file|code|api|data|screenshot|"
+    r"navigat(?:e|ion)|read|write|documentation|docs))"
+)
+_TAG_ALIASES = {
+    "navigate": "navigation",
+    "docs": "documentation",
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _tags_for_description(description: str) -> Tuple[str, ...]:
+    """Keyword tags for a description, memoized across rediscovery runs"""
+    matches = _TAG_PATTERN.findall(description.lower())
+    return tuple({_TAG_ALIASES.get(match, match) for match in matches})
+
+
+@functools.lru_cache(maxsize=4096)
+def _token_estimate(description: str, schema_text: str) -> int:
+    """Token estimate for a description and rendered schema, memoized"""
+    # Simple estimation based on description and schema size
+    desc_tokens = len(description.split()) * 1.3
+    schema_tokens = len(schema_text.split()) * 1.3
+    return int(desc_tokens + schema_tokens + 50)  # Base overhead
+
+
+# Specific summaries by tool-name pattern, checked in order:
+# (name substring, template, argument to show, default)
+_ACTION_SUMMARIES = (
+    ("search", "Will search for '{}'", "query", ""),
+    ("screenshot", "Will capture screenshot '{}'", "name", "screenshot"),
+    ("write", "Will write note '{}'", "title", "note"),
+    ("research", "Will research '{}'", "query", "target"),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _summary_rule(tool_name: str) -> Optional[Tuple[str, str, str]]:
+    """First summary rule matching a tool name, resolved once per name"""
+    name_lower = tool_name.lower()
+    for keyword, template, arg_name, default in _ACTION_SUMMARIES:
+        if keyword in name_lower:
+            return template, arg_name, default
+    return None
+
+
 class ProxyService:
     """Manages proxy operations for tool execution across MCP servers"""
     
     def __init__(
         self, 
         client_manager: MCPClientManager,
-        tool_repository: InMemoryToolRepository
+        tool_repository: InMemoryToolRepository,
+        cacheable_tools: Optional[Set[str]] = None,
+        result_cache_size: int = 512,
+        result_cache_ttl: float = 60.0,
+        gating: Optional[GatingService] = None,
+        registry: Optional[MCPServerRegistry] = None
     ):
         self.client_manager = client_manager
         self.tool_repository = tool_repository
+        # Optional collaborators wired in once at startup
+        self.gating = gating
+        self.registry = registry
         self.provisioned_tools: Set[str] = set()
+        # Opt-in result cache for read-only tools: (tool_id, args JSON) -> (expiry, result)
+        self.cacheable_tools: Set[str] = cacheable_tools or set()
+        self._result_cache: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._result_cache_size = result_cache_size
+        self._result_cache_ttl = result_cache_ttl
     
     async def discover_all_tools(self) -> None:
         """Discover and index tools from all connected servers"""
-        # Import here to avoid circular imports
-        from ..main import app
-        
-        # Get registry from app state if available
-        registry = getattr(app.state, 'registry', None) if hasattr(app, 'state') else None
-        # Optional gating service
-        gating = getattr(app.state, 'gating', None) if hasattr(app, 'state') else None
+        registry = self.registry
+        gating = self.gating
 
         for server_name, tools in self.client_manager.server_tools.items():
             # Update gating discovered list (names only)
@@ -36,19 +99,21 @@ class ProxyService:
                     gating.set_discovered(server_name, [getattr(t, 'name', 'unknown') for t in tools])
             except Exception:
                 pass
+            tool_objs = []
             for tool in tools:
+                description = getattr(tool, 'description', '') or ""
                 # Convert MCP tool to our Tool model
-                tool_obj = Tool(
+                tool_objs.append(Tool(
                     id=f"{server_name}_{tool.name}",
                     name=getattr(tool, 'name', 'unknown'),
-                    description=getattr(tool, 'description', '') or "",
+                    description=description,
                     parameters=getattr(tool, 'inputSchema', getattr(tool, 'parameters', {})) or {},
                     server=server_name,
-                    tags=self._extract_tags(getattr(tool, 'description', '')),
+                    tags=self._extract_tags(description),
                     estimated_tokens=self._estimate_tokens(tool)
-                )
-                # Use sync version of add_tool
-                self.tool_repository.add_tool_sync(tool_obj)
+                ))
+            # Index the whole server's tools in one repository update
+            self.tool_repository.bulk_add_tools(tool_objs)
             
             # Update the server registry with the tool count for this server
             if registry:
@@ -65,6 +130,7 @@ class ProxyService:
             tool_id: Tool identifier to provision
         """
         self.provisioned_tools.add(tool_id)
+        self._invalidate_results(tool_id)
     
     def unprovision_tool(self, tool_id: str) -> None:
         """Remove a tool from provisioned set
@@ -73,6 +139,7 @@ class ProxyService:
             tool_id: Tool identifier to unprovision
         """
         self.provisioned_tools.discard(tool_id)
+        self._invalidate_results(tool_id)
     
     def is_provisioned(self, tool_id: str) -> bool:
         """Check if a tool is provisioned
@@ -121,22 +188,12 @@ class ProxyService:
         Returns:
             Action summary string
         """
-        # Generate specific summaries based on tool patterns
-        if "search" in tool.name.lower():
-            query = arguments.get("query", "")
-            return f"Will search for '{query}'"
-        elif "screenshot" in tool.name.lower():
-            name = arguments.get("name", "screenshot")
-            return f"Will capture screenshot '{name}'"
-        elif "write" in tool.name.lower():
-            title = arguments.get("title", "note")
-            return f"Will write note '{title}'"
-        elif "research" in tool.name.lower():
-            target = arguments.get("query", "target")
-            return f"Will research '{target}'"
-        else:
+        rule = _summary_rule(tool.name)
+        if rule is None:
             # Generic summary
             return f"Will execute {tool.name} with provided arguments"
+        template, arg_name, default = rule
+        return template.format(arguments.get(arg_name, default))
     
     async def execute_tool(self, tool_id: str, arguments: dict) -> Any:
         """Execute a tool via proxy with real-time loading
@@ -163,21 +220,41 @@ class ProxyService:
         if not tool:
             raise ValueError(f"Tool {tool_id} not found in repository")
         # Enforce gating if available
-        try:
-            from ..main import app  # late import to avoid cycles
-            gating = getattr(app.state, 'gating', None) if hasattr(app, 'state') else None
-            if gating is not None and not gating.is_published(tool_id):
-                raise ValueError(
-                    f"Tool '{tool_id}' is not published (gated). Use /api/tools/provision to publish it first."
-                )
-        except ValueError:
-            raise
-        except Exception:
-            # If gating unavailable, default to current behavior
-            pass
+        if self.gating is not None and not self.gating.is_published(tool_id):
+            raise ValueError(
+                f"Tool '{tool_id}' is not published (gated). Use /api/tools/provision to publish it first."
+            )
+        
+        cache_key = self._result_cache_key(tool_id, arguments)
+        if cache_key is not None:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._result_cache.move_to_end(cache_key)
+                return cached[1]
         
         # Execute via client manager - real-time loading happens here
-        return await self.client_manager.execute_tool(server_name, tool_name, arguments)
+        result = await self.client_manager.execute_tool(server_name, tool_name, arguments)
+        
+        if cache_key is not None:
+            self._result_cache[cache_key] = (time.monotonic() + self._result_cache_ttl, result)
+            self._result_cache.move_to_end(cache_key)
+            while len(self._result_cache) > self._result_cache_size:
+                self._result_cache.popitem(last=False)
+        return result
+    
+    def _result_cache_key(self, tool_id: str, arguments: dict) -> Optional[Tuple[str, str]]:
+        """Cache key for a tool call, or None if its result must not be reused"""
+        if tool_id not in self.cacheable_tools or self._result_cache_ttl <= 0:
+            return None
+        try:
+            return tool_id, json.dumps(arguments, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return None
+    
+    def _invalidate_results(self, tool_id: str) -> None:
+        """Drop cached results for a tool"""
+        for key in [k for k in self._result_cache if k[0] == tool_id]:
+            del self._result_cache[key]
     
     def _extract_tags(self, description: Optional[str]) -> List[str]:
         """Extract tags from tool description
@@ -191,28 +268,7 @@ class ProxyService:
         if not description:
             return []
         
-        # Simple tag extraction based on keywords
-        tags = []
-        keywords = ["search", "web", "browser", "file", "code", "api", "data"]
-        desc_lower = description.lower()
-        
-        for keyword in keywords:
-            if keyword in desc_lower:
-                tags.append(keyword)
-        
-        # Add more specific tags based on common patterns
-        if "screenshot" in desc_lower:
-            tags.append("screenshot")
-        if "navigate" in desc_lower or "navigation" in desc_lower:
-            tags.append("navigation")
-        if "read" in desc_lower:
-            tags.append("read")
-        if "write" in desc_lower:
-            tags.append("write")
-        if "documentation" in desc_lower or "docs" in desc_lower:
-            tags.append("documentation")
-        
-        return list(set(tags))  # Remove duplicates
+        return list(_tags_for_description(description))
     
     def _estimate_tokens(self, tool: Any) -> int:
         """Estimate token count for a tool
@@ -223,7 +279,7 @@ class ProxyService:
         Returns:
             Estimated token count
         """
-        # Simple estimation based on description and schema size
-        desc_tokens = len(str(getattr(tool, 'description', '') or "").split()) * 1.3
-        schema_tokens = len(str(getattr(tool, 'inputSchema', {}) or {}).split()) * 1.3
-        return int(desc_tokens + schema_tokens + 50)  # Base overhead
+        return _token_estimate(
+            str(getattr(tool, 'description', '') or ""),
+            str(getattr(tool, 'inputSchema', {}) or {}),
+        )
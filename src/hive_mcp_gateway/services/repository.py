@@ -1,6 +1,7 @@
 # Tool repository
 # In-memory implementation of tool storage
 
+from collections.abc import Iterable
 
 from ..models.tool import Tool
 
@@ -37,6 +38,10 @@ class InMemoryToolRepository:
         if tool.id not in self._usage_counts:
             self._usage_counts[tool.id] = 0
 
+    async def add_tools(self, tools: Iterable[Tool]) -> None:
+        """Add many tools to the repository in one update."""
+        self.bulk_add_tools(tools)
+
     async def remove_tool(self, tool_id: str) -> None:
         """Remove a tool from the repository."""
         if tool_id in self._tools:
@@ -44,6 +49,11 @@ class InMemoryToolRepository:
             if tool_id in self._usage_counts:
                 del self._usage_counts[tool_id]
 
+    async def clear(self) -> None:
+        """Remove all tools and their usage counts."""
+        self._tools = {}
+        self._usage_counts = {}
+
     async def increment_usage(self, tool_id: str) -> None:
         """Increment usage count for a tool."""
         if tool_id in self._tools:
@@ -56,6 +66,13 @@ class InMemoryToolRepository:
         if tool.id not in self._usage_counts:
             self._usage_counts[tool.id] = 0
 
+    def bulk_add_tools(self, tools: Iterable[Tool]) -> None:
+        """Add many tools in one update (sync version)."""
+        added = {tool.id: tool for tool in tools}
+        self._tools.update(added)
+        for tool_id in added:
+            self._usage_counts.setdefault(tool_id, 0)
+
     def get_tool(self, tool_id: str) -> Tool | None:
         """Get a tool by ID (sync version)."""
         return self._tools.get(tool_id)
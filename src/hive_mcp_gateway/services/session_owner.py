@@ -0,0 +1,84 @@
+"""Own an MCP transport and session inside one dedicated task.
+
+The MCP SDK's stdio_client/sse_client wrap an anyio task group, whose cancel
+scope must be exited by the same task that entered it. Connect and disconnect
+usually run in different tasks (a request handler vs. shutdown), so instead of
+calling ``__aenter__``/``__aexit__`` by hand, each server gets an owner task
+that enters the transport, holds it open and exits it when asked to close.
+"""
+
+import asyncio
+import logging
+from typing import Any, Optional
+
+from mcp import ClientSession
+
+logger = logging.getLogger(__name__)
+
+
+class SessionOwner:
+    """Keep a transport context and its ClientSession open in a single task."""
+
+    def __init__(self, name: str, context: Any):
+        self.name = name
+        self._context = context
+        self._task: Optional[asyncio.Task] = None
+        self._ready: Optional[asyncio.Future] = None
+        self._stop = asyncio.Event()
+
+    async def start(self, timeout: float) -> ClientSession:
+        """Enter the transport and initialize the session within ``timeout``.
+
+        Raises whatever the connect raised; the owner task is already gone then.
+        """
+        self._ready = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(timeout), name=f"mcp-session-{self.name}")
+        try:
+            return await self._ready
+        except BaseException:
+            await self.close()
+            raise
+
+    async def _run(self, timeout: float) -> None:
+        ready = self._ready
+        try:
+            async with asyncio.timeout(timeout) as deadline:
+                async with self._context as (read_stream, write_stream):
+                    async with ClientSession(read_stream, write_stream) as session:
+                        await session.initialize()
+                        # Connected: lift the deadline and hold the session until close()
+                        deadline.reschedule(None)
+                        if ready.done():
+                            # The caller gave up while we were connecting
+                            return
+                        ready.set_result(session)
+                        await self._stop.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+            raise
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.debug(f"Session for {self.name} closed with error: {e}")
+
+    async def close(self, timeout: float = 3.0, kill_timeout: float = 2.0) -> None:
+        """Ask the owner task to exit the transport and wait for it to finish.
+
+        Leaving stdio_client sends SIGTERM; a child still running after
+        ``timeout`` is killed by cancelling the owner, since anyio kills the
+        process when its wait is cancelled.
+        """
+        task = self._task
+        if task is None or task.done():
+            return
+        self._stop.set()
+        if not self._ready.done() or self._ready.cancelled():
+            # Still connecting; nothing to hand back, so just abort
+            task.cancel()
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+        if not done:
+            logger.warning(f"Session for {self.name} did not close within {timeout}s; killing")
+            task.cancel()
+            await asyncio.wait({task}, timeout=kill_timeout)
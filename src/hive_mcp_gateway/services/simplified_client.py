@@ -19,6 +19,11 @@ class SimplifiedMCPClient:
     
     Key principle: We NEVER spawn STDIO processes directly. 
     All STDIO servers are managed by mcp-proxy and accessed via HTTP/SSE.
+    
+    Sessions are long-lived: connect once and reuse the session for every
+    ``execute_tool`` call. Callers should not wrap individual tool calls in
+    ``connect_server``/``disconnect_server``, as each connect costs a full
+    SSE handshake.
     """
     
     def __init__(self, proxy_base_url: str = "http://127.0.0.1:9090"):
@@ -33,7 +38,17 @@ class SimplifiedMCPClient:
         
         For STDIO servers configured with 'via: proxy', we connect to the 
         mcp-proxy endpoint. For direct HTTP/SSE servers, we connect directly.
+        Connecting a server that is already connected reuses its session.
         """
+        info = self._server_info.get(name)
+        if name in self.sessions and info and info.get("connected"):
+            return {
+                "status": "success",
+                "message": f"Already connected to {name}",
+                "tools_count": len(self.server_tools.get(name, [])),
+                "connection_path": info.get("connection_type", "unknown")
+            }
+        
         try:
             server_type = config.get("type", "stdio")
             via = config.get("via", "direct")
@@ -172,31 +187,41 @@ class SimplifiedMCPClient:
         if name in self._server_info:
             self._server_info[name]["connected"] = False
     
-    async def check_proxy_health(self) -> bool:
-        """Check if mcp-proxy is running and responsive."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                # Try multiple possible health endpoints
-                for endpoint in ['/health', '/status', '/', '/servers']:
-                    try:
-                        url = f"{self.proxy_base_url}{endpoint}"
-                        async with session.get(url, timeout=2) as resp:
-                            if resp.status in [200, 404, 501]:
-                                return True
-                    except:
-                        continue
-            return False
-        except:
-            return False
+    async def check_proxy_health(self, session: Optional[aiohttp.ClientSession] = None) -> bool:
+        """Check if mcp-proxy is running and responsive.
+        
+        Pass ``session`` to reuse one connection pool across repeated polls.
+        """
+        if session is None:
+            try:
+                async with aiohttp.ClientSession() as session:
+                    return await self.check_proxy_health(session)
+            except:
+                return False
+        
+        # Try multiple possible health endpoints, cheapest first
+        for endpoint in ['/', '/health', '/status', '/servers']:
+            try:
+                url = f"{self.proxy_base_url}{endpoint}"
+                async with session.get(url, timeout=2) as resp:
+                    if resp.status in [200, 404, 501]:
+                        return True
+            except aiohttp.ClientConnectionError:
+                # Nothing is listening yet; other paths won't fare better
+                return False
+            except:
+                continue
+        return False
     
     async def wait_for_proxy(self, timeout: int = 30) -> bool:
         """Wait for mcp-proxy to become available."""
         start = asyncio.get_event_loop().time()
-        while (asyncio.get_event_loop().time() - start) < timeout:
-            if await self.check_proxy_health():
-                logger.info("MCP Proxy is ready")
-                return True
-            await asyncio.sleep(0.5)
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=4)) as session:
+            while (asyncio.get_event_loop().time() - start) < timeout:
+                if await self.check_proxy_health(session):
+                    logger.info("MCP Proxy is ready")
+                    return True
+                await asyncio.sleep(0.5)
         logger.error(f"MCP Proxy not available after {timeout}s")
         return False
     
@@ -3,19 +3,52 @@
 import asyncio
 import json
 import logging
-from typing import Optional, AsyncIterator
+import re
+from typing import Optional, AsyncIterator, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Bytes that can change scanner state outside and inside JSON strings
+_STRUCTURAL = re.compile(rb'[{}"]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+# An object opening: a brace followed by a key or a closing brace
+_OBJECT_START = re.compile(rb'\{\s*["}]')
+
+
+def _is_json(message: bytes) -> bool:
+    """Whether a candidate message parses as JSON."""
+    if orjson is not None:
+        try:
+            orjson.loads(message)
+            return True
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. integers beyond 64 bits); let json decide
+            pass
+    try:
+        json.loads(message)
+        return True
+    except ValueError:
+        return False
+
 
 class StdioStreamFilter:
     """Filters non-JSON content from STDIO streams to prevent protocol corruption."""
     
     def __init__(self, name: str):
         self.name = name
-        self.buffer = ""
+        self.buffer = bytearray()
         self.in_json = False
         self.brace_count = 0
+        self.in_string = False
+        self._escaped = False
+        # Trailing "{" whose next byte has not arrived yet
+        self._pending = b""
+        self._tasks: list[asyncio.Task] = []
         
     async def filter_stream(self, read_stream, write_stream):
         """
@@ -23,84 +56,147 @@ class StdioStreamFilter:
         
         This wraps the raw STDIO streams and filters out any non-JSON content
         like banners, warnings, or debug output that would corrupt the MCP protocol.
+        Only the read side needs filtering; writes go straight to the server.
         """
-        # Create new streams for the filtered content
-        filtered_read, filtered_write = asyncio.Queue(), asyncio.Queue()
+        filtered = asyncio.Queue()
         
         async def filter_input():
             """Filter incoming data from the STDIO server."""
             try:
                 async for chunk in self._read_chunks(read_stream):
                     # Look for JSON-RPC messages (start with '{')
-                    filtered = self._filter_chunk(chunk)
-                    if filtered:
-                        await filtered_write.put(filtered)
+                    result = self._filter_chunk(chunk)
+                    if result:
+                        await filtered.put(result)
             except Exception as e:
                 logger.error(f"Error filtering input for {self.name}: {e}")
                 
-        async def forward_output():
-            """Forward output to the STDIO server unchanged."""
-            try:
-                while True:
-                    data = await filtered_read.get()
-                    await write_stream.send(data)
-            except Exception as e:
-                logger.error(f"Error forwarding output for {self.name}: {e}")
-                
-        # Start filter tasks
-        asyncio.create_task(filter_input())
-        asyncio.create_task(forward_output())
+        # Start filter task, keeping a reference so it can be cancelled on close
+        self._tasks.append(asyncio.create_task(filter_input(), name=f"filter-in-{self.name}"))
+        
+        return _FilteredRead(filtered), write_stream
         
-        return filtered_read, filtered_write
+    async def close(self):
+        """Stop the filter tasks started by ``filter_stream``."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         
-    def _filter_chunk(self, chunk: str) -> Optional[str]:
+    def _filter_chunk(self, chunk: Union[bytes, str]) -> Optional[bytes]:
         """
-        Filter a chunk of text to extract only valid JSON-RPC messages.
+        Filter a chunk of output to extract only valid JSON-RPC messages.
         
         This handles cases where:
         - Banners are printed before JSON
         - Multiple JSON messages are in one chunk
         - JSON messages are split across chunks
+        
+        Rather than stepping through every character, the scanner jumps
+        between the bytes that matter (braces and quotes, or quotes and
+        backslashes inside strings), so the per-byte work happens in C.
         """
+        data = chunk.encode('utf-8') if isinstance(chunk, str) else bytes(chunk)
+        if self._pending:
+            data = self._pending + data
+            self._pending = b""
+        view = memoryview(data)
         result = []
+        pos = 0
+        end = len(data)
         
-        for char in chunk:
-            if char == '{':
+        while pos < end:
+            if not self.in_json:
+                # Skip banner text up to the next object
+                match = _OBJECT_START.search(data, pos)
+                if match is None:
+                    # Keep a trailing brace until we can tell if it opens JSON
+                    brace = data.rfind(b'{', pos)
+                    if brace >= 0 and not data[brace + 1:].strip():
+                        self._pending = data[brace:]
+                    break
+                pos = match.start()
                 self.in_json = True
-                self.brace_count = 1
-                self.buffer = '{'
-            elif self.in_json:
-                self.buffer += char
-                if char == '{':
+                self.brace_count = 0
+                self.in_string = False
+                self._escaped = False
+                self.buffer.clear()
+            
+            segment_start = pos
+            complete = False
+            while True:
+                if self._escaped:
+                    # Previous chunk ended on a backslash inside a string
+                    self._escaped = False
+                    pos += 1
+                pattern = _STRING_SPECIAL if self.in_string else _STRUCTURAL
+                match = pattern.search(data, pos) if pos < end else None
+                if match is None:
+                    pos = end
+                    break
+                char = data[match.start()]
+                pos = match.end()
+                if self.in_string:
+                    if char == 0x5C:  # backslash
+                        if pos < end:
+                            pos += 1
+                        else:
+                            self._escaped = True
+                            break
+                    else:
+                        self.in_string = False
+                elif char == 0x22:  # quote
+                    self.in_string = True
+                elif char == 0x7B:  # {
                     self.brace_count += 1
-                elif char == '}':
+                else:
                     self.brace_count -= 1
                     if self.brace_count == 0:
-                        # Complete JSON object found
-                        try:
-                            # Validate it's actual JSON
-                            json.loads(self.buffer)
-                            result.append(self.buffer)
-                        except json.JSONDecodeError:
-                            logger.debug(f"Invalid JSON filtered from {self.name}: {self.buffer[:100]}")
-                        finally:
-                            self.in_json = False
-                            self.buffer = ""
+                        complete = True
+                        break
+            
+            if not complete:
+                # Object continues in the next chunk; keep what we have so far
+                self.buffer += view[segment_start:pos]
+                continue
+            if self.buffer:
+                self.buffer += view[segment_start:pos]
+                message = bytes(self.buffer)
+                self.buffer.clear()
+            else:
+                # Whole object is inside this chunk: slice it out directly
+                message = data[segment_start:pos]
+            self.in_json = False
+            # Complete JSON object found; validate it's actual JSON
+            if _is_json(message):
+                result.append(message)
+            else:
+                logger.debug(f"Invalid JSON filtered from {self.name}: {message[:100]!r}")
                             
-        return ''.join(result) if result else None
+        return b''.join(result) if result else None
         
-    async def _read_chunks(self, stream) -> AsyncIterator[str]:
-        """Read chunks from a stream."""
+    async def _read_chunks(self, stream) -> AsyncIterator[Union[bytes, str]]:
+        """Read chunks from a stream, passed through undecoded."""
         while True:
             try:
                 chunk = await stream.receive()
                 if chunk:
-                    yield chunk.decode('utf-8') if isinstance(chunk, bytes) else chunk
+                    yield chunk
             except Exception as e:
                 logger.error(f"Error reading from {self.name}: {e}")
                 break
 
 
+class _FilteredRead:
+    """Read side of a filtered stream, exposing the ``receive()`` stream API."""
+    
+    def __init__(self, queue: asyncio.Queue):
+        self._queue = queue
+        
+    async def receive(self) -> bytes:
+        return await self._queue.get()
+
+
 class FilteredStdioClient:
     """Drop-in replacement for stdio_client that filters banner text."""
     
@@ -120,4 +216,7 @@ class FilteredStdioClient:
             filter = StdioStreamFilter(name)
             filtered_read, filtered_write = await filter.filter_stream(raw_read, raw_write)
             
-            yield filtered_read, filtered_write
+            try:
+                yield filtered_read, filtered_write
+            finally:
+                await filter.close()
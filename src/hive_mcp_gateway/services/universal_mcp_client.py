@@ -11,7 +11,12 @@ Key features:
 import asyncio
 import logging
 import os
-from typing import Dict, Any, List, Optional, Tuple
+import re
+import shutil
+import time
+from collections import deque
+from types import MappingProxyType
+from typing import Deque, Dict, Any, List, Mapping, Optional, TextIO, Tuple
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from enum import Enum
@@ -19,10 +24,38 @@ from enum import Enum
 from mcp import ClientSession
 from mcp.client.stdio import stdio_client, StdioServerParameters
 from mcp.client.sse import sse_client
-import aiohttp
+
+from .error_handler import ConfigurationError, backoff_delay, is_retryable
+from .mcp_registry import MCPServerRegistry
+from .session_owner import SessionOwner
 
 logger = logging.getLogger(__name__)
 
+# When the gateway runs in Docker, local URLs must point at the host instead
+_DOCKER_HOST_REMAP = os.getenv("USE_DOCKER_HOST") == "true"
+_LOCAL_HOST_RE = re.compile(r"\b(?:localhost|127\.0\.0\.1)\b")
+
+# Environment overrides applied to every STDIO server to keep stdout clean
+_BANNER_ENV: Mapping[str, str] = MappingProxyType({
+    # Python/FastMCP banner suppression
+    "FASTMCP_NO_BANNER": "1",
+    "FASTMCP_DISABLE_BANNER": "1",
+    "FASTMCP_QUIET": "1",
+    "PYTHONUNBUFFERED": "1",
+    "PYTHONWARNINGS": "ignore",
+    "NO_COLOR": "1",
+    # Node.js banner suppression
+    "NODE_NO_WARNINGS": "1",
+    "DISABLE_BANNER": "1",
+    "QUIET": "1",
+    # Generic
+    "SILENT": "1",
+    "CI": "1",  # Many tools detect CI and suppress output
+})
+
+# Lines of piped stderr kept per server for diagnostics
+_STDERR_TAIL_LINES = 200
+
 
 class TransportType(Enum):
     """MCP transport types."""
@@ -39,7 +72,7 @@ class StderrMode(Enum):
     INHERIT = "inherit"  # Pass through (dangerous - can corrupt protocol)
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfig:
     """Configuration for an MCP server."""
     name: str
@@ -57,9 +90,22 @@ class ServerConfig:
     retry_count: int = 3
     retry_delay: float = 2.5
     timeout: float = 30.0
+    
+    def __post_init__(self):
+        # Resolve the launcher once here rather than on every connect attempt
+        if self.command and not os.path.isabs(self.command):
+            self.command = shutil.which(self.command) or self.command
 
 
-@dataclass
+@dataclass(slots=True)
+class _MockTool:
+    """Placeholder tool reported by the mock HTTP transport."""
+    name: str
+    description: str
+    inputSchema: Dict[str, Any]
+
+
+@dataclass(slots=True)
 class ConnectedClient:
     """A connected MCP client with cleanup capability."""
     name: str
@@ -81,17 +127,55 @@ class ConnectedClient:
 class UniversalMCPClient:
     """Universal MCP client that handles all transport types properly."""
     
-    def __init__(self):
+    def __init__(self, registry: Optional[MCPServerRegistry] = None):
+        self.registry = registry
         self.sessions: Dict[str, ConnectedClient] = {}
         self.server_tools: Dict[str, List[Any]] = {}
         self._stdio_contexts: Dict[str, Any] = {}
+        # Monotonic time before which a server that just failed is not retried
+        self._next_retry_after: Dict[str, float] = {}
+        # Background tool discovery per server; held so tasks aren't GC'd mid-run
+        self._discovery_tasks: Dict[str, asyncio.Task] = {}
+        # Connects in progress, so concurrent callers share one attempt
+        self._connecting: Dict[str, asyncio.Future] = {}
+        # Last stderr lines of servers run with StderrMode.PIPE, and their drain tasks
+        self._stderr_tails: Dict[str, Deque[str]] = {}
+        self._stderr_tasks: Dict[str, asyncio.Task] = {}
         
     async def connect_server(self, config: ServerConfig) -> Dict[str, Any]:
         """Connect to an MCP server using the appropriate transport.
         
+        Concurrent calls for the same server wait on the connect already in
+        progress instead of spawning a second process.
+        
         Returns:
             dict with status, message, tools_count, and connection details
         """
+        pending = self._connecting.get(config.name)
+        if pending is not None:
+            # Shielded so a waiter being cancelled doesn't cancel the shared result
+            return await asyncio.shield(pending)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._connecting[config.name] = future
+        try:
+            result = await self._connect_server(config)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved; the owning caller re-raises it below
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._connecting.pop(config.name, None)
+    
+    async def _connect_server(self, config: ServerConfig) -> Dict[str, Any]:
+        """Connect with retries; callers go through ``connect_server``."""
         # Check if already connected
         if config.name in self.sessions:
             existing = self.sessions[config.name]
@@ -102,6 +186,15 @@ class UniversalMCPClient:
                 "transport": config.type.value
             }
         
+        # Don't respawn a server that is still cooling down from a failure
+        retry_after = self._next_retry_after.get(config.name, 0.0) - time.monotonic()
+        if retry_after > 0:
+            return {
+                "status": "error",
+                "message": f"Connection to {config.name} recently failed; retry in {retry_after:.1f}s",
+                "tools_count": 0
+            }
+        
         # Try to connect with retries
         for attempt in range(config.retry_count):
             try:
@@ -119,13 +212,22 @@ class UniversalMCPClient:
                     }
                 
                 if result["status"] == "success":
+                    self._next_retry_after.pop(config.name, None)
                     return result
                     
             except Exception as e:
                 logger.warning(f"Connection attempt {attempt + 1}/{config.retry_count} failed for {config.name}: {e}")
+                if not is_retryable(e):
+                    self._next_retry_after[config.name] = time.monotonic() + backoff_delay(attempt, config.retry_delay)
+                    return {
+                        "status": "error",
+                        "message": f"Failed with non-retryable error: {str(e)}",
+                        "tools_count": 0
+                    }
                 if attempt < config.retry_count - 1:
-                    await asyncio.sleep(config.retry_delay)
+                    await asyncio.sleep(backoff_delay(attempt, config.retry_delay))
                 else:
+                    self._next_retry_after[config.name] = time.monotonic() + backoff_delay(attempt + 1, config.retry_delay)
                     return {
                         "status": "error",
                         "message": f"Failed after {config.retry_count} attempts: {str(e)}",
@@ -142,25 +244,11 @@ class UniversalMCPClient:
         """Connect to a STDIO MCP server with proper stderr handling."""
         try:
             logger.info(f"Connecting to STDIO server {config.name} with stderr={config.stderr.value}")
+            if not config.command:
+                raise ConfigurationError(f"No command configured for STDIO server {config.name}")
             
-            # Build environment with banner suppression
-            env = dict(config.env or {})
-            env.update({
-                # Python/FastMCP banner suppression
-                "FASTMCP_NO_BANNER": "1",
-                "FASTMCP_DISABLE_BANNER": "1",
-                "FASTMCP_QUIET": "1",
-                "PYTHONUNBUFFERED": "1",
-                "PYTHONWARNINGS": "ignore",
-                "NO_COLOR": "1",
-                # Node.js banner suppression
-                "NODE_NO_WARNINGS": "1",
-                "DISABLE_BANNER": "1",
-                "QUIET": "1",
-                # Generic
-                "SILENT": "1",
-                "CI": "1",  # Many tools detect CI and suppress output
-            })
+            # Banner suppression wins over the configured environment
+            env = {**(config.env or {}), **_BANNER_ENV}
             
             # Map stderr mode to MCP SDK parameter
             # Meta-MCP uses "ignore" by default which is the key to preventing corruption
@@ -177,33 +265,33 @@ class UniversalMCPClient:
                 stderr=stderr_param  # Critical: Set to "ignore" to prevent banner corruption
             )
             
-            # Create and connect
-            context = stdio_client(server_params)
-            self._stdio_contexts[config.name] = context
-            
-            # Enter context with timeout
-            read_stream, write_stream = await asyncio.wait_for(
-                context.__aenter__(),
-                timeout=config.timeout
-            )
-            
-            # Create session
-            session = ClientSession(read_stream, write_stream)
-            
-            # Initialize with timeout
-            await asyncio.wait_for(session.initialize(), timeout=config.timeout)
+            # Create and connect; the owner task enters and later exits the transport
+            if config.stderr == StderrMode.PIPE:
+                errlog = self._open_stderr_pipe(config.name)
+                context = stdio_client(server_params, errlog=errlog)
+            else:
+                errlog = None
+                context = stdio_client(server_params)
+            owner = SessionOwner(config.name, context)
+            self._stdio_contexts[config.name] = owner
+            try:
+                session = await owner.start(config.timeout)
+            finally:
+                # The child holds its own copy now; ours would keep the drain from seeing EOF
+                if errlog is not None:
+                    errlog.close()
             
             # Store connected client
             connected = ConnectedClient(
                 name=config.name,
                 client=session,
-                transport=context,
-                cleanup_func=lambda: context.__aexit__(None, None, None)
+                transport=owner,
+                cleanup_func=owner.close
             )
             self.sessions[config.name] = connected
             
             # Discover tools in background
-            asyncio.create_task(self._discover_tools(config.name, session))
+            self._start_discovery(config.name, session)
             
             logger.info(f"Successfully connected to STDIO server {config.name}")
             return {
@@ -226,12 +314,11 @@ class UniversalMCPClient:
         """Connect to an SSE MCP server."""
         try:
             logger.info(f"Connecting to SSE server {config.name} at {config.url}")
+            if not config.url:
+                raise ConfigurationError(f"No URL configured for SSE server {config.name}")
             
             # Transform localhost URLs if running in Docker
-            url = config.url
-            if os.getenv("USE_DOCKER_HOST") == "true":
-                url = url.replace("localhost", "host.docker.internal")
-                url = url.replace("127.0.0.1", "host.docker.internal")
+            url = _LOCAL_HOST_RE.sub("host.docker.internal", config.url) if _DOCKER_HOST_REMAP else config.url
             
             # Create SSE connection with headers if provided
             if config.headers:
@@ -239,29 +326,20 @@ class UniversalMCPClient:
             else:
                 context = sse_client(url)
             
-            # Connect with timeout
-            read_stream, write_stream = await asyncio.wait_for(
-                context.__aenter__(),
-                timeout=config.timeout
-            )
-            
-            # Create session
-            session = ClientSession(read_stream, write_stream)
-            
-            # Initialize
-            await asyncio.wait_for(session.initialize(), timeout=config.timeout)
+            owner = SessionOwner(config.name, context)
+            session = await owner.start(config.timeout)
             
             # Store connected client
             connected = ConnectedClient(
                 name=config.name,
                 client=session,
-                transport=context,
-                cleanup_func=lambda: context.__aexit__(None, None, None)
+                transport=owner,
+                cleanup_func=owner.close
             )
             self.sessions[config.name] = connected
             
             # Discover tools in background
-            asyncio.create_task(self._discover_tools(config.name, session))
+            self._start_discovery(config.name, session)
             
             logger.info(f"Successfully connected to SSE server {config.name}")
             return {
@@ -282,11 +360,11 @@ class UniversalMCPClient:
         logger.info(f"Mock connection to HTTP server {config.name}")
         
         mock_tools = [
-            type('MockTool', (), {
-                'name': f'{config.name}_tool',
-                'description': f'Mock tool for {config.name}',
-                'inputSchema': {'type': 'object', 'properties': {}}
-            })()
+            _MockTool(
+                name=f'{config.name}_tool',
+                description=f'Mock tool for {config.name}',
+                inputSchema={'type': 'object', 'properties': {}}
+            )
         ]
         
         self.server_tools[config.name] = mock_tools
@@ -298,64 +376,110 @@ class UniversalMCPClient:
             "transport": "http"
         }
     
+    def _start_discovery(self, name: str, session: ClientSession) -> None:
+        """Run tool discovery for a server in the background."""
+        previous = self._discovery_tasks.pop(name, None)
+        if previous:
+            previous.cancel()
+        task = asyncio.create_task(self._discover_tools(name, session), name=f"discover-{name}")
+        self._discovery_tasks[name] = task
+        task.add_done_callback(
+            lambda t: self._discovery_tasks.pop(name) if self._discovery_tasks.get(name) is t else None
+        )
+    
     async def _discover_tools(self, name: str, session: ClientSession):
         """Discover tools from a connected session."""
         try:
-            response = await asyncio.wait_for(
-                session.list_tools(),
-                timeout=30.0
-            )
-            tools = response.tools if hasattr(response, 'tools') else []
+            async with asyncio.timeout(30.0):
+                response = await session.list_tools()
+            tools = getattr(response, 'tools', None) or []
             self.server_tools[name] = tools
             logger.info(f"Discovered {len(tools)} tools from {name}")
             
             # Update registry if available
-            try:
-                from ..main import app
-                registry = getattr(app.state, "registry", None)
-                if registry:
-                    registry.update_server_tool_count(name, len(tools))
-            except:
-                pass
+            if self.registry is not None:
+                self.registry.update_server_tool_count(name, len(tools))
                 
         except Exception as e:
             logger.error(f"Error discovering tools from {name}: {e}")
             self.server_tools[name] = []
     
+    def _open_stderr_pipe(self, name: str) -> TextIO:
+        """Create a pipe for a server's stderr and start draining it.
+        
+        Keeping the pipe drained stops a chatty server from blocking on a full
+        pipe buffer; only the last ``_STDERR_TAIL_LINES`` lines are retained.
+        """
+        read_fd, write_fd = os.pipe()
+        tail: Deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+        self._stderr_tails[name] = tail
+        previous = self._stderr_tasks.pop(name, None)
+        if previous:
+            previous.cancel()
+        task = asyncio.create_task(self._drain_stderr(name, read_fd, tail), name=f"stderr-{name}")
+        self._stderr_tasks[name] = task
+        task.add_done_callback(
+            lambda t: self._stderr_tasks.pop(name) if self._stderr_tasks.get(name) is t else None
+        )
+        return os.fdopen(write_fd, "w")
+    
+    async def _drain_stderr(self, name: str, read_fd: int, tail: Deque[str]):
+        """Read a server's stderr until EOF, keeping the tail and logging each line."""
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), os.fdopen(read_fd, "rb", 0)
+        )
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Overlong line; the reader already discarded it
+                    continue
+                if not line:
+                    break
+                text = line.decode("utf-8", errors="replace").rstrip()
+                tail.append(text)
+                logger.debug(f"[{name} stderr] {text}")
+        finally:
+            transport.close()
+    
+    def get_stderr_tail(self, name: str) -> List[str]:
+        """Get the last stderr lines of a server connected with StderrMode.PIPE."""
+        return list(self._stderr_tails.get(name, ()))
+    
     async def _cleanup_stdio(self, name: str):
         """Clean up STDIO connection."""
         try:
-            if name in self._stdio_contexts:
-                context = self._stdio_contexts[name]
-                try:
-                    await asyncio.wait_for(
-                        context.__aexit__(None, None, None),
-                        timeout=5.0
-                    )
-                except:
-                    pass
-                del self._stdio_contexts[name]
-            if name in self.sessions:
-                del self.sessions[name]
+            owner = self._stdio_contexts.pop(name, None)
+            self.sessions.pop(name, None)
+            if owner:
+                await owner.close()
         except Exception as e:
             logger.debug(f"Cleanup error for {name}: {e}")
     
     async def disconnect_server(self, name: str):
         """Disconnect from a server."""
-        if name in self.sessions:
-            client = self.sessions[name]
+        task = self._discovery_tasks.pop(name, None)
+        if task:
+            task.cancel()
+        client = self.sessions.pop(name, None)
+        self.server_tools.pop(name, None)
+        self._stdio_contexts.pop(name, None)
+        if client:
             await client.cleanup()
-            del self.sessions[name]
-        if name in self.server_tools:
-            del self.server_tools[name]
-        if name in self._stdio_contexts:
-            del self._stdio_contexts[name]
     
     async def disconnect_all(self):
         """Disconnect from all servers."""
         names = list(self.sessions.keys())
-        for name in names:
-            await self.disconnect_server(name)
+        # Shut servers down together so the total wait is the slowest one, not the sum
+        await asyncio.gather(*(self.disconnect_server(name) for name in names), return_exceptions=True)
+        # Reap any discovery or stderr draining still running for servers that failed mid-connect
+        pending = [*self._discovery_tasks.values(), *self._stderr_tasks.values()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
     
     def get_server_tools(self, name: str) -> List[Any]:
         """Get tools for a server."""
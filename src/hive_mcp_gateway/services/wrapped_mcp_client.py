@@ -5,124 +5,150 @@ The wrapper uses mcps-logger or fallback filtering to keep stdout clean for JSON
 """
 
 import asyncio
+import functools
 import logging
 import os
 import shutil
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 
 from mcp import ClientSession
 from mcp.client.stdio import stdio_client, StdioServerParameters
 from mcp.client.sse import sse_client
 
+from .error_handler import ConfigurationError, backoff_delay, is_retryable
+from .session_owner import SessionOwner
+
 logger = logging.getLogger(__name__)
 
+_WRAPPER_PATH = Path(__file__).parent / "stdio_wrapper.js"
+
+_WRAPPER_ENV: Mapping[str, str] = MappingProxyType({
+    "NODE_ENV": "development",  # Enable mcps-logger patches
+    "PYTHONUNBUFFERED": "1",
+    "FASTMCP_NO_BANNER": "1",
+})
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_cmd(name: str) -> Optional[str]:
+    """Resolve a command on PATH once per process.
+    
+    Many servers share launchers such as npx, uvx or python, so this saves
+    a PATH walk per connect.
+    """
+    return shutil.which(name)
+
 
 class WrappedMCPClient:
     """MCP client that uses Node.js wrapper for STDIO servers."""
     
+    # Set once the wrapper script has been seen, so new instances skip the stat
+    _wrapper_found = False
+    
     def __init__(self):
         self.sessions: Dict[str, ClientSession] = {}
         self.server_tools: Dict[str, List[Any]] = {}
-        self._stdio_contexts: Dict[str, Any] = {}
+        # Transport owners by server name (STDIO and SSE alike)
+        self._stdio_contexts: Dict[str, SessionOwner] = {}
         
         # Find Node.js
-        self.node_path = shutil.which("node")
+        self.node_path = _resolve_cmd("node")
         if not self.node_path:
             raise RuntimeError("Node.js not found. Please install Node.js.")
         
         # Find wrapper script
-        wrapper_dir = Path(__file__).parent
-        self.wrapper_path = wrapper_dir / "stdio_wrapper.js"
-        if not self.wrapper_path.exists():
-            raise RuntimeError(f"Wrapper script not found: {self.wrapper_path}")
+        self.wrapper_path = _WRAPPER_PATH
+        if not WrappedMCPClient._wrapper_found:
+            if not self.wrapper_path.exists():
+                raise RuntimeError(f"Wrapper script not found: {self.wrapper_path}")
+            WrappedMCPClient._wrapper_found = True
     
     async def connect_stdio_server(self, name: str, config: dict) -> Dict[str, Any]:
         """Connect to a STDIO server using the Node.js wrapper.
         
         The wrapper prevents banner text from corrupting the JSON-RPC protocol.
+        Transient failures are retried with jittered exponential backoff;
+        errors such as a missing command fail immediately.
         """
-        try:
-            logger.info(f"Connecting to STDIO server {name} via wrapper")
-            
-            # Original command and args
-            original_command = config.get("command", "")
-            original_args = config.get("args", [])
-            
-            # Resolve command path if needed
-            if not os.path.isabs(original_command):
-                resolved = shutil.which(original_command)
-                if resolved:
-                    original_command = resolved
-            
-            # New command: node wrapper.js <original_command> <args...>
-            wrapped_command = self.node_path
-            wrapped_args = [
-                str(self.wrapper_path),
-                original_command,
-                *original_args
-            ]
-            
-            # Build environment
-            env = dict(config.get("env", {}))
-            env.update({
-                "NODE_ENV": "development",  # Enable mcps-logger patches
-                "PYTHONUNBUFFERED": "1",
-                "FASTMCP_NO_BANNER": "1",
-            })
-            
-            # Create server parameters with wrapped command
-            server_params = StdioServerParameters(
-                command=wrapped_command,
-                args=wrapped_args,
-                env=env
-            )
-            
-            # Connect using standard stdio_client
-            context = stdio_client(server_params)
-            self._stdio_contexts[name] = context
-            
-            # Enter context
-            read_stream, write_stream = await asyncio.wait_for(
-                context.__aenter__(),
-                timeout=30
-            )
-            
-            # Create session
-            session = ClientSession(read_stream, write_stream)
-            
-            # Initialize session
-            await asyncio.wait_for(session.initialize(), timeout=30)
-            
-            # Store session
-            self.sessions[name] = session
-            
-            # Discover tools
-            await self._discover_tools(name, session)
-            
-            logger.info(f"Successfully connected to {name} with {len(self.server_tools.get(name, []))} tools")
-            
-            return {
-                "status": "success",
-                "message": f"Connected to {name}",
-                "tools_count": len(self.server_tools.get(name, [])),
-                "wrapped": True
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to connect to {name}: {e}")
-            await self._cleanup_stdio(name)
-            return {
-                "status": "error",
-                "message": str(e),
-                "tools_count": 0
-            }
+        retry_count = max(1, config.get("retry_count", 3))
+        retry_delay = config.get("retry_delay", 2.5)
+        for attempt in range(retry_count):
+            try:
+                return await self._connect_stdio_once(name, config)
+            except Exception as e:
+                logger.error(f"Failed to connect to {name} (attempt {attempt + 1}/{retry_count}): {e}")
+                await self._cleanup_stdio(name)
+                if not is_retryable(e) or attempt == retry_count - 1:
+                    return {
+                        "status": "error",
+                        "message": str(e),
+                        "tools_count": 0
+                    }
+                await asyncio.sleep(backoff_delay(attempt, retry_delay))
+    
+    async def _connect_stdio_once(self, name: str, config: dict) -> Dict[str, Any]:
+        """Make a single wrapped STDIO connection attempt, raising on failure."""
+        logger.info(f"Connecting to STDIO server {name} via wrapper")
+        
+        # Original command and args
+        original_command = config.get("command", "")
+        original_args = config.get("args", [])
+        if not original_command:
+            raise ConfigurationError(f"No command configured for STDIO server {name}")
+        
+        # Resolve command path if needed
+        if not os.path.isabs(original_command):
+            resolved = _resolve_cmd(original_command)
+            if resolved:
+                original_command = resolved
+        
+        # New command: node wrapper.js <original_command> <args...>
+        wrapped_command = self.node_path
+        wrapped_args = [
+            str(self.wrapper_path),
+            original_command,
+            *original_args
+        ]
+        
+        # Build environment
+        env = {**config.get("env", {}), **_WRAPPER_ENV}
+        
+        # Create server parameters with wrapped command
+        server_params = StdioServerParameters(
+            command=wrapped_command,
+            args=wrapped_args,
+            env=env
+        )
+        
+        # Connect using standard stdio_client; the owner task enters and later exits it
+        owner = SessionOwner(name, stdio_client(server_params))
+        self._stdio_contexts[name] = owner
+        session = await owner.start(30)
+        
+        # Store session
+        self.sessions[name] = session
+        
+        # Discover tools
+        await self._discover_tools(name, session)
+        
+        logger.info(f"Successfully connected to {name} with {len(self.server_tools.get(name, []))} tools")
+        
+        return {
+            "status": "success",
+            "message": f"Connected to {name}",
+            "tools_count": len(self.server_tools.get(name, [])),
+            "wrapped": True
+        }
     
     async def connect_sse_server(self, name: str, config: dict) -> Dict[str, Any]:
         """Connect to an SSE server (no wrapper needed)."""
         try:
             url = config.get("url")
             headers = config.get("headers", {})
+            if not url:
+                raise ConfigurationError(f"No URL configured for SSE server {name}")
             
             logger.info(f"Connecting to SSE server {name} at {url}")
             
@@ -132,19 +158,11 @@ class WrappedMCPClient:
             else:
                 context = sse_client(url)
             
-            # Connect
-            read_stream, write_stream = await asyncio.wait_for(
-                context.__aenter__(),
-                timeout=30
-            )
-            
-            # Create session
-            session = ClientSession(read_stream, write_stream)
-            
-            # Initialize
-            await asyncio.wait_for(session.initialize(), timeout=30)
+            owner = SessionOwner(name, context)
+            session = await owner.start(30)
             
             # Store
+            self._stdio_contexts[name] = owner
             self.sessions[name] = session
             
             # Discover tools
@@ -167,11 +185,9 @@ class WrappedMCPClient:
     async def _discover_tools(self, name: str, session: ClientSession):
         """Discover tools from a connected session."""
         try:
-            response = await asyncio.wait_for(
-                session.list_tools(),
-                timeout=10
-            )
-            tools = response.tools if hasattr(response, 'tools') else []
+            async with asyncio.timeout(10):
+                response = await session.list_tools()
+            tools = getattr(response, 'tools', None) or []
             self.server_tools[name] = tools
             logger.info(f"Discovered {len(tools)} tools from {name}")
         except Exception as e:
@@ -181,16 +197,9 @@ class WrappedMCPClient:
     async def _cleanup_stdio(self, name: str):
         """Clean up STDIO connection."""
         try:
-            if name in self._stdio_contexts:
-                context = self._stdio_contexts[name]
-                try:
-                    await asyncio.wait_for(
-                        context.__aexit__(None, None, None),
-                        timeout=5
-                    )
-                except:
-                    pass
-                del self._stdio_contexts[name]
+            owner = self._stdio_contexts.pop(name, None)
+            if owner:
+                await owner.close()
             if name in self.sessions:
                 del self.sessions[name]
         except Exception as e:
@@ -211,5 +220,5 @@ class WrappedMCPClient:
     
     async def disconnect_all(self):
         """Disconnect all servers."""
-        for name in list(self.sessions.keys()):
-            await self._cleanup_stdio(name)
+        names = list(self.sessions.keys())
+        await asyncio.gather(*(self._cleanup_stdio(name) for name in names), return_exceptions=True)
@@ -206,7 +206,7 @@ def error_scenarios():
 async def cleanup_after_test():
     """Cleanup fixture that runs after each test"""
     # Clear repository before test
-    from hive_mcp_gateway.api.tools import _tool_repository
+    _tool_repository = getattr(app.state, "tool_repository", None)
     if _tool_repository:
         _tool_repository._tools.clear()
         _tool_repository._usage_counts.clear()
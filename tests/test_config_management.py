@@ -226,6 +226,18 @@ class TestConfigManager:
         config = config_manager.load_config()
         assert "mgmt_test" not in config.backend_mcp_servers
 
+    def test_add_identical_server_skips_write(self, config_manager):
+        """Test re-adding an unchanged server doesn't rewrite the config file."""
+        server = BackendServerConfig(type="stdio", command="same-command")
+        assert config_manager.add_backend_server("same", server)
+
+        with patch.object(config_manager, "save_config") as save:
+            assert not config_manager.add_backend_server("same", server.model_copy())
+            save.assert_not_called()
+
+            assert config_manager.add_backend_server("same", BackendServerConfig(type="stdio", command="other"))
+            save.assert_called_once()
+
     def test_backup_config(self, config_manager, temp_config_file):
         """Test configuration backup functionality."""
         backup_path = config_manager.backup_config()
@@ -13,10 +13,16 @@ These tests ensure the system provides useful error information
 and maintains stability under adverse conditions.
 """
 
+import asyncio
+import json
+
 import pytest
 from unittest.mock import patch, AsyncMock
 from fastapi import HTTPException
 
+from hive_mcp_gateway.services.error_handler import ConfigurationError, backoff_delay, is_retryable
+from hive_mcp_gateway.services.universal_mcp_client import ServerConfig, TransportType, UniversalMCPClient
+
 
 class TestInputValidation:
     """Test validation of inputs and error responses"""
@@ -437,4 +443,83 @@ class TestRecoveryScenarios:
         response = client.post("/api/tools/discover", json={"query": "search"})
         assert response.status_code == 200
         results = response.json()
-        assert len(results["tools"]) > 0
\ No newline at end of file
+        assert len(results["tools"]) > 0
+
+
+class TestConnectionRetryPolicy:
+    """Test backoff and cooldown when connecting to backend servers"""
+
+    def test_backoff_grows_and_is_capped(self):
+        """Test backoff doubles per attempt within the jitter band and respects the cap"""
+        for attempt in range(4):
+            delay = backoff_delay(attempt, 1.0)
+            assert 0.5 * 2 ** attempt <= delay <= 1.5 * 2 ** attempt
+
+        assert backoff_delay(20, 1.0, max_delay=30.0) <= 45.0
+
+    def test_backoff_is_jittered(self):
+        """Test repeated delays for the same attempt are not identical"""
+        assert len({backoff_delay(2, 1.0) for _ in range(20)}) > 1
+
+    def test_retryable_classification(self):
+        """Test config errors fail fast while handshake parse errors are retried"""
+        assert not is_retryable(FileNotFoundError("npx"))
+        assert not is_retryable(ConfigurationError("no command"))
+        with pytest.raises(json.JSONDecodeError) as parse_error:
+            json.loads("Welcome banner")
+        assert is_retryable(parse_error.value)
+        assert is_retryable(TimeoutError())
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_retries_then_cools_down(self):
+        """Test transient failures are retried, then the server is not respawned until cooldown ends"""
+        client = UniversalMCPClient()
+        config = ServerConfig(name="flaky", type=TransportType.STDIO, command="x", retry_count=3, retry_delay=0.01)
+
+        with patch.object(client, "_connect_stdio", AsyncMock(side_effect=TimeoutError())) as connect:
+            result = await client.connect_server(config)
+            assert result["status"] == "error"
+            assert connect.await_count == 3
+            assert client._next_retry_after["flaky"] > 0
+
+            # Within the cooldown window the server is not tried again
+            result = await client.connect_server(config)
+            assert "recently failed" in result["message"]
+            assert connect.await_count == 3
+
+        # Once the cooldown has passed, a successful connect clears it
+        client._next_retry_after["flaky"] = 0.0
+        success = {"status": "success", "message": "ok", "tools_count": 0, "transport": "stdio"}
+        with patch.object(client, "_connect_stdio", AsyncMock(return_value=success)):
+            assert (await client.connect_server(config))["status"] == "success"
+        assert "flaky" not in client._next_retry_after
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_failure_fails_fast(self):
+        """Test a missing command is not retried"""
+        client = UniversalMCPClient()
+        config = ServerConfig(name="missing", type=TransportType.STDIO, command="x", retry_count=3, retry_delay=0.01)
+
+        with patch.object(client, "_connect_stdio", AsyncMock(side_effect=FileNotFoundError("x"))) as connect:
+            result = await client.connect_server(config)
+
+        assert connect.await_count == 1
+        assert "non-retryable" in result["message"]
+        assert "missing" in client._next_retry_after
+
+    @pytest.mark.asyncio
+    async def test_concurrent_connects_share_one_attempt(self):
+        """Test racing connects for one server don't spawn it twice"""
+        client = UniversalMCPClient()
+        config = ServerConfig(name="shared", type=TransportType.STDIO, command="x")
+
+        async def slow_connect(_config):
+            await asyncio.sleep(0.05)
+            return {"status": "success", "message": "ok", "tools_count": 0, "transport": "stdio"}
+
+        with patch.object(client, "_connect_stdio", AsyncMock(side_effect=slow_connect)) as connect:
+            results = await asyncio.gather(*(client.connect_server(config) for _ in range(5)))
+
+        assert connect.await_count == 1
+        assert all(r["status"] == "success" for r in results)
+        assert not client._connecting
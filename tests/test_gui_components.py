@@ -3,7 +3,7 @@
 import pytest
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QTimer
 from PyQt6.QtTest import QTest
@@ -144,14 +144,15 @@ class TestOAuthDialogIntegration:
         
         oauth_dialog.current_flow = mock_flow
         oauth_dialog.server_name = "test_server"
-        oauth_dialog.oauth_manager.complete_flow.return_value = mock_result
+        oauth_dialog.oauth_manager.complete_flow = AsyncMock(return_value=mock_result)
+        oauth_dialog.oauth_manager.close = AsyncMock()
         
         # Simulate callback
         callback_url = "http://localhost:8080/callback?code=test_code&state=test_state"
         oauth_dialog.on_auth_callback(callback_url)
         
         # Verify flow completion was attempted
-        oauth_dialog.oauth_manager.complete_flow.assert_called_once_with(mock_flow, callback_url)
+        oauth_dialog.oauth_manager.complete_flow.assert_awaited_once_with(mock_flow, callback_url)
 
 
 class TestCredentialManagementGUI:
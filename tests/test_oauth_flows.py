@@ -102,7 +102,7 @@ class TestOAuthFlowScenarios:
         flow = oauth_manager.initiate_flow("google")
         callback_url = f"http://localhost:8080/callback?code=auth_code_123&state={flow.state}"
         
-        result = oauth_manager.complete_flow(flow, callback_url)
+        result = await oauth_manager.complete_flow(flow, callback_url)
         
         # Verify successful completion
         assert result.success == True
@@ -111,7 +111,7 @@ class TestOAuthFlowScenarios:
         assert result.expires_at is not None
         
         # Verify token was stored
-        stored_token = oauth_manager.get_valid_token("google")
+        stored_token = await oauth_manager.get_valid_token("google")
         assert stored_token == "access_token_12345"
     
     @patch('httpx.AsyncClient.post')
@@ -130,7 +130,7 @@ class TestOAuthFlowScenarios:
         flow = oauth_manager.initiate_flow("google")
         callback_url = f"http://localhost:8080/callback?code=invalid_code&state={flow.state}"
         
-        result = oauth_manager.complete_flow(flow, callback_url)
+        result = await oauth_manager.complete_flow(flow, callback_url)
         
         # Verify error handling
         assert result.success == False
@@ -143,7 +143,7 @@ class TestOAuthFlowScenarios:
         # Use wrong state parameter
         callback_url = "http://localhost:8080/callback?code=auth_code_123&state=wrong_state"
         
-        result = oauth_manager.complete_flow(flow, callback_url)
+        result = await oauth_manager.complete_flow(flow, callback_url)
         
         # Should fail due to state mismatch
         assert result.success == False
@@ -156,7 +156,7 @@ class TestOAuthFlowScenarios:
         # Callback without code parameter
         callback_url = f"http://localhost:8080/callback?state={flow.state}"
         
-        result = oauth_manager.complete_flow(flow, callback_url)
+        result = await oauth_manager.complete_flow(flow, callback_url)
         
         # Should fail due to missing code
         assert result.success == False
@@ -169,13 +169,13 @@ class TestOAuthFlowScenarios:
         # Callback with error
         callback_url = f"http://localhost:8080/callback?error=access_denied&error_description=User+denied+access&state={flow.state}"
         
-        result = oauth_manager.complete_flow(flow, callback_url)
+        result = await oauth_manager.complete_flow(flow, callback_url)
         
         # Should fail with user-friendly error
         assert result.success == False
         assert "access_denied" in result.error
     
-    def test_flow_expiration(self, oauth_manager):
+    async def test_flow_expiration(self, oauth_manager):
         """Test OAuth flow expiration handling."""
         # Create flow
         flow = oauth_manager.initiate_flow("google")
@@ -187,7 +187,7 @@ class TestOAuthFlowScenarios:
         
         # Try to complete expired flow
         callback_url = f"http://localhost:8080/callback?code=auth_code_123&state={flow.state}"
-        result = oauth_manager.complete_flow(flow, callback_url)
+        result = await oauth_manager.complete_flow(flow, callback_url)
         
         # Should fail due to expiration
         assert result.success == False
@@ -215,14 +215,14 @@ class TestOAuthFlowScenarios:
         mock_post.return_value = mock_response
         
         # Attempt token refresh
-        result = oauth_manager.refresh_token("test_service")
+        result = await oauth_manager.refresh_token("test_service")
         
         # Verify refresh success
         assert result.success == True
         assert result.token_data["access_token"] == "new_access_token"
         
         # Verify new token is stored
-        new_token = oauth_manager.get_valid_token("test_service")
+        new_token = await oauth_manager.get_valid_token("test_service")
         assert new_token == "new_access_token"
     
     async def test_token_revocation(self, oauth_manager):
@@ -239,7 +239,7 @@ class TestOAuthFlowScenarios:
         
         # Verify revocation
         assert success == True
-        assert oauth_manager.get_valid_token("test_service") is None
+        assert await oauth_manager.get_valid_token("test_service") is None
     
     def test_pkce_implementation(self, oauth_manager):
         """Test PKCE (Proof Key for Code Exchange) implementation."""
@@ -395,7 +395,7 @@ class TestOAuthIntegrationScenarios:
     def auth_detector(self):
         return AuthDetector()
     
-    def test_oauth_flow_with_auth_detection(self, oauth_manager, auth_detector):
+    async def test_oauth_flow_with_auth_detection(self, oauth_manager, auth_detector):
         """Test complete OAuth flow triggered by auth detection."""
         server_name = "google_service"
         
@@ -423,7 +423,7 @@ class TestOAuthIntegrationScenarios:
             mock_post.return_value = mock_response
             
             callback_url = f"http://localhost:8080/callback?code=auth_code&state={flow.state}"
-            result = oauth_manager.complete_flow(flow, callback_url)
+            result = await oauth_manager.complete_flow(flow, callback_url)
             
             assert result.success == True
         
@@ -468,9 +468,9 @@ class TestOAuthIntegrationScenarios:
         callback3 = f"http://localhost:8080/callback?code=code3&state={flow3.state}"
         
         results = await asyncio.gather(
-            asyncio.create_task(asyncio.to_thread(oauth_manager.complete_flow, flow1, callback1)),
-            asyncio.create_task(asyncio.to_thread(oauth_manager.complete_flow, flow2, callback2)),
-            asyncio.create_task(asyncio.to_thread(oauth_manager.complete_flow, flow3, callback3))
+            oauth_manager.complete_flow(flow1, callback1),
+            oauth_manager.complete_flow(flow2, callback2),
+            oauth_manager.complete_flow(flow3, callback3)
         )
         
         # Verify all completed successfully
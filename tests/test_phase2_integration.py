@@ -88,7 +88,7 @@ class TestOAuthIntegration:
         
         flow = oauth_manager.initiate_flow("google")
         callback_url = f"http://localhost:8080/callback?code=auth_code&state={flow.state}"
-        result = oauth_manager.complete_flow(flow, callback_url)
+        result = await oauth_manager.complete_flow(flow, callback_url)
         
         assert result.success == True
         assert result.token_data["access_token"] == "token_123"
@@ -188,7 +188,7 @@ class TestEndToEndIntegration:
                 "notification_manager": notification_manager
             }
     
-    def test_oauth_credential_flow(self, integrated_system):
+    async def test_oauth_credential_flow(self, integrated_system):
         """Test complete OAuth + credential flow."""
         oauth_manager = integrated_system["oauth_manager"]
         auth_detector = integrated_system["auth_detector"]
@@ -215,14 +215,14 @@ class TestEndToEndIntegration:
             mock_post.return_value = mock_response
             
             callback_url = f"http://localhost:8080/callback?code=auth_code&state={flow.state}"
-            result = oauth_manager.complete_flow(flow, callback_url)
+            result = await oauth_manager.complete_flow(flow, callback_url)
             assert result.success == True
         
         # 4. Record success
         auth_detector.record_success("google_service")
         
         # 5. Verify token availability
-        token = oauth_manager.get_valid_token("google_service")
+        token = await oauth_manager.get_valid_token("google_service")
         assert token is not None
     
     def test_monitoring_integration(self, integrated_system):
@@ -0,0 +1,58 @@
+"""
+Pipe Log Tail Tests
+
+Tests _tail_lines, which reads the piped client's log file backwards:
+- Returns exactly the requested number of trailing lines
+- Handles lines spanning chunk boundaries and missing trailing newlines
+- Handles files shorter than the request and empty files
+"""
+
+import pytest
+
+from hive_mcp_gateway.services.piped_mcp_client import _tail_lines
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "pipe.log"
+    path.write_text("".join(f"line {i}\n" for i in range(1000)))
+    return str(path)
+
+
+class TestTailLines:
+    """Test reading the last lines of a log file"""
+
+    def test_returns_last_lines(self, log_file):
+        """Test the last N lines are returned in order"""
+        assert _tail_lines(log_file, 3) == ["line 997\n", "line 998\n", "line 999\n"]
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 9, 64])
+    def test_small_chunks_match_full_read(self, log_file, chunk_size):
+        """Test lines split across chunk boundaries are reassembled"""
+        with open(log_file) as f:
+            expected = f.readlines()[-25:]
+        assert _tail_lines(log_file, 25, chunk_size=chunk_size) == expected
+
+    def test_no_trailing_newline(self, tmp_path):
+        """Test the final unterminated line counts as a line"""
+        path = tmp_path / "pipe.log"
+        path.write_text("a\nb\nc")
+        assert _tail_lines(str(path), 2, chunk_size=2) == ["b\n", "c"]
+
+    def test_more_lines_than_file(self, tmp_path):
+        """Test asking for more lines than exist returns the whole file"""
+        path = tmp_path / "pipe.log"
+        path.write_text("a\nb\n")
+        assert _tail_lines(str(path), 10) == ["a\n", "b\n"]
+
+    def test_empty_file(self, tmp_path):
+        """Test an empty file yields no lines"""
+        path = tmp_path / "pipe.log"
+        path.write_text("")
+        assert _tail_lines(str(path), 5) == []
+
+    def test_invalid_utf8_is_replaced(self, tmp_path):
+        """Test undecodable bytes don't break reading"""
+        path = tmp_path / "pipe.log"
+        path.write_bytes(b"ok\n\xff\xfe bad\n")
+        assert _tail_lines(str(path), 1) == ["�� bad\n"]
@@ -0,0 +1,64 @@
+"""
+Piped Client Tool Cache Tests
+
+Tests how PipedMCPClient reuses tool lists across reconnects:
+- A quick reconnect with the same config skips list_tools
+- A changed config is always rediscovered
+- A reconnect after the cache TTL picks up a changed tool set
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from hive_mcp_gateway.services.piped_mcp_client import PipedMCPClient, _TOOLS_CACHE_TTL
+
+MONOTONIC = "hive_mcp_gateway.services.piped_mcp_client.time.monotonic"
+
+
+def _session(*tool_names):
+    session = AsyncMock()
+    session.list_tools.return_value = SimpleNamespace(tools=list(tool_names))
+    return session
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(PipedMCPClient, "PIPE_PATH_UNIX", str(tmp_path / "pipe.log"))
+    monkeypatch.setattr(PipedMCPClient, "PIPE_PATH_WINDOWS", str(tmp_path / "pipe.log"))
+    return PipedMCPClient()
+
+
+class TestToolsCache:
+    """Test reuse and expiry of discovered tool lists"""
+
+    async def test_quick_reconnect_reuses_tools(self, client):
+        """Test a reconnect with the same config skips list_tools"""
+        with patch(MONOTONIC, return_value=100.0):
+            await client._discover_tools("files", _session("read"), "hash")
+        session = _session("read", "write")
+        with patch(MONOTONIC, return_value=101.0):
+            await client._discover_tools("files", session, "hash")
+
+        session.list_tools.assert_not_awaited()
+        assert client.server_tools["files"] == ["read"]
+
+    async def test_changed_config_is_rediscovered(self, client):
+        """Test a different config hash always lists tools again"""
+        with patch(MONOTONIC, return_value=100.0):
+            await client._discover_tools("files", _session("read"), "hash")
+            await client._discover_tools("files", _session("read", "write"), "other")
+
+        assert client.server_tools["files"] == ["read", "write"]
+
+    async def test_reconnect_after_ttl_sees_new_tools(self, client):
+        """Test a backend upgraded behind an unchanged config is rediscovered"""
+        with patch(MONOTONIC, return_value=100.0):
+            await client._discover_tools("files", _session("read"), "hash")
+        session = _session("read", "write")
+        with patch(MONOTONIC, return_value=100.0 + _TOOLS_CACHE_TTL):
+            await client._discover_tools("files", session, "hash")
+
+        session.list_tools.assert_awaited_once()
+        assert client.server_tools["files"] == ["read", "write"]
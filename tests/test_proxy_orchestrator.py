@@ -0,0 +1,155 @@
+"""
+Proxy Orchestrator Tests
+
+Tests how MCPProxyOrchestrator applies configuration changes:
+- An unchanged config neither restarts the proxy nor rewrites its config file
+- Key order in the gateway config doesn't count as a change
+- A real change reloads the proxy
+- A failed start forgets the config so the next update tries again
+- Concurrent updates with the same config start the proxy only once
+- Reaping a proxy that is slow to exit doesn't block the event loop
+"""
+
+import asyncio
+import subprocess
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from hive_mcp_gateway.models.config import ToolGatingConfig
+from hive_mcp_gateway.services.proxy_orchestrator import MCPProxyOrchestrator
+
+
+def _config(env):
+    return ToolGatingConfig(backendMcpServers={
+        "files": {"type": "stdio", "command": "npx", "args": ["server-files"], "env": env},
+        "remote": {"type": "sse", "url": "http://localhost:8001/sse"},
+    })
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    """Orchestrator whose process start/reload are mocked out"""
+    orch = MCPProxyOrchestrator("config.json", tmp_path)
+    orch.try_start = AsyncMock(return_value=True)
+    orch.reload = AsyncMock(return_value=True)
+    return orch
+
+
+class TestConfigUpdates:
+    """Test that config updates only restart the proxy when needed"""
+
+    async def test_first_update_starts_proxy(self, orchestrator, tmp_path):
+        """Test the first update writes the config and starts the proxy"""
+        assert await orchestrator.update_config(_config({"A": "1"}))
+
+        orchestrator.try_start.assert_awaited_once()
+        assert (tmp_path / "mcp_proxy_config.json").exists()
+
+    async def test_unchanged_config_is_skipped(self, orchestrator, tmp_path):
+        """Test re-applying the same config neither restarts nor rewrites"""
+        await orchestrator.update_config(_config({"A": "1", "B": "2"}))
+        config_file = tmp_path / "mcp_proxy_config.json"
+        mtime = config_file.stat().st_mtime_ns
+
+        with patch.object(orchestrator, "is_running", return_value=True):
+            # Same content, different key order
+            assert await orchestrator.update_config(_config({"B": "2", "A": "1"}))
+
+        orchestrator.reload.assert_not_awaited()
+        assert orchestrator.try_start.await_count == 1
+        assert config_file.stat().st_mtime_ns == mtime
+
+    async def test_changed_config_reloads(self, orchestrator, tmp_path):
+        """Test a different config is written and reloads the running proxy"""
+        await orchestrator.update_config(_config({"A": "1"}))
+
+        with patch.object(orchestrator, "is_running", return_value=True):
+            assert await orchestrator.update_config(_config({"A": "2"}))
+
+        orchestrator.reload.assert_awaited_once()
+        assert b'"2"' in (tmp_path / "mcp_proxy_config.json").read_bytes()
+
+    async def test_stopped_proxy_is_restarted_with_same_config(self, orchestrator):
+        """Test an unchanged config still starts the proxy if it isn't running"""
+        await orchestrator.update_config(_config({"A": "1"}))
+
+        with patch.object(orchestrator, "is_running", return_value=False):
+            await orchestrator.update_config(_config({"A": "1"}))
+
+        assert orchestrator.try_start.await_count == 2
+
+    async def test_failed_start_is_retried(self, orchestrator):
+        """Test a config whose start failed is applied again on the next update"""
+        orchestrator.try_start.return_value = False
+        assert not await orchestrator.update_config(_config({"A": "1"}))
+
+        orchestrator.try_start.return_value = True
+        assert await orchestrator.update_config(_config({"A": "1"}))
+        assert orchestrator.try_start.await_count == 2
+
+    async def test_concurrent_updates_start_once(self, orchestrator):
+        """Test overlapping updates don't both start a proxy"""
+        running = False
+
+        async def slow_start(conf_file):
+            nonlocal running
+            await asyncio.sleep(0.01)
+            running = True
+            return True
+
+        orchestrator.try_start.side_effect = slow_start
+        with patch.object(orchestrator, "is_running", side_effect=lambda: running):
+            results = await asyncio.gather(
+                orchestrator.update_config(_config({"A": "1"})),
+                orchestrator.update_config(_config({"A": "1"})),
+            )
+
+        assert results == [True, True]
+        orchestrator.try_start.assert_awaited_once()
+
+
+class TestProcessCleanup:
+    """Test stopping a failed proxy from async code"""
+
+    async def test_reaping_slow_process_keeps_loop_responsive(self, tmp_path):
+        """Test the loop keeps running while a SIGTERM-ignoring proxy is reaped"""
+        orch = MCPProxyOrchestrator("config.json", tmp_path)
+        # Ignores SIGTERM and exits on its own shortly after
+        script = (
+            "import signal, sys, time\n"
+            "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+            "print('ready', flush=True)\n"
+            "time.sleep(0.5)\n"
+        )
+
+        async def candidates(config_file):
+            yield [sys.executable, "-c", script]
+
+        def spawn(argv):
+            proc = subprocess.Popen(argv, stdout=subprocess.PIPE)
+            proc.stdout.readline()
+            proc.stdout.close()
+            return proc
+
+        orch._candidates = candidates
+        orch._spawn = spawn
+        orch._await_ready = AsyncMock(return_value=False)
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            assert not await orch.try_start(tmp_path / "mcp_proxy_config.json")
+        finally:
+            ticker_task.cancel()
+
+        assert orch.proc is None
+        assert ticks >= 10
@@ -248,6 +248,27 @@ class TestMemoryManagement:
             response = client.post("/api/tools/discover", json={"query": "isolation"})
             assert len(response.json()["tools"]) == 0
 
+    @pytest.mark.asyncio
+    async def test_reregistered_tool_is_reembedded(self, tool_repository, sample_tools):
+        """Test a tool re-added after a clear isn't scored with its old embedding"""
+        from hive_mcp_gateway.services.discovery import DiscoveryService
+
+        with patch("hive_mcp_gateway.services.discovery.SentenceTransformer") as model:
+            encode = model.return_value.encode
+            encode.side_effect = lambda text: [float(len(text)), 1.0]
+            service = DiscoveryService(tool_repo=tool_repository)
+            tool = sample_tools[0]
+
+            await tool_repository.add_tool(tool)
+            await service.find_relevant_tools("query")
+            await tool_repository.clear()
+            assert await tool_repository.get_all() == []
+
+            await tool_repository.add_tool(tool.model_copy(update={"description": "rewritten"}))
+            await service.find_relevant_tools("query")
+
+        assert any("rewritten" in call.args[0] for call in encode.call_args_list)
+
 
 class TestScalabilityLimits:
     """Test system behavior at scale limits"""
@@ -340,4 +361,78 @@ class TestScalabilityLimits:
         # All queries should complete quickly
         assert total_time < 5.0
         # Average time per query should be reasonable
-        assert total_time / len(query_patterns) < 0.5
\ No newline at end of file
+        assert total_time / len(query_patterns) < 0.5
+
+
+class TestConnectionReuse:
+    """Test that re-adding a connected server reuses its session"""
+
+    @pytest.mark.asyncio
+    async def test_identical_config_skips_reconnect(self):
+        """Test connecting again with the same config doesn't respawn the server"""
+        from unittest.mock import AsyncMock
+        from hive_mcp_gateway.services.mcp_client_manager import MCPClientManager
+
+        manager = MCPClientManager()
+        config = {"type": "stdio", "command": "server", "args": []}
+
+        async def fake_connect(name, cfg):
+            manager.sessions[name] = AsyncMock()
+            manager.server_tools[name] = ["tool_a", "tool_b"]
+            return {"status": "success", "tools_count": 2}
+
+        with patch.object(manager, "_connect_stdio_server", AsyncMock(side_effect=fake_connect)) as connect:
+            await manager.connect_server("files", config)
+            again = await manager.connect_server("files", dict(config))
+            assert connect.await_count == 1
+            assert again["status"] == "success" and again["tools_count"] == 2
+            manager.sessions["files"].send_ping.assert_awaited_once()
+
+            # A changed config, or a disconnect, forces a real connect
+            await manager.connect_server("files", {**config, "args": ["--verbose"]})
+            assert connect.await_count == 2
+            await manager.disconnect_server("files")
+            await manager.connect_server("files", config)
+            assert connect.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_dead_session_is_reconnected(self):
+        """Test an identical config reconnects when the live session stops answering pings"""
+        from unittest.mock import AsyncMock
+        from hive_mcp_gateway.services.mcp_client_manager import MCPClientManager
+
+        manager = MCPClientManager()
+        config = {"type": "stdio", "command": "server", "args": []}
+
+        async def fake_connect(name, cfg):
+            manager.sessions[name] = AsyncMock()
+            return {"status": "success", "tools_count": 0}
+
+        with patch.object(manager, "_connect_stdio_server", AsyncMock(side_effect=fake_connect)) as connect:
+            await manager.connect_server("files", config)
+            # The backend crashed: its session no longer answers
+            manager.sessions["files"].send_ping.side_effect = ConnectionResetError()
+            result = await manager.connect_server("files", config)
+
+        assert connect.await_count == 2
+        assert result.get("message") != "Already connected to files"
+
+    @pytest.mark.asyncio
+    async def test_mutating_callers_config_forces_reconnect(self):
+        """Test the stored config is a copy the caller can't change afterwards"""
+        from unittest.mock import AsyncMock
+        from hive_mcp_gateway.services.mcp_client_manager import MCPClientManager
+
+        manager = MCPClientManager()
+        config = {"type": "stdio", "command": "server", "args": []}
+
+        async def fake_connect(name, cfg):
+            manager.sessions[name] = AsyncMock()
+            return {"status": "success", "tools_count": 0}
+
+        with patch.object(manager, "_connect_stdio_server", AsyncMock(side_effect=fake_connect)) as connect:
+            await manager.connect_server("files", config)
+            config["command"] = "other-server"
+            await manager.connect_server("files", config)
+
+        assert connect.await_count == 2
@@ -0,0 +1,97 @@
+"""
+Tool Result Cache Tests
+
+Tests ProxyService's result cache for tools marked cacheable:
+- Repeated identical calls are served from cache within the TTL
+- Entries expire after the TTL
+- The least recently used entry is evicted at capacity
+- Provisioning or unprovisioning a tool drops its cached results
+- Tools not marked cacheable are always executed
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from hive_mcp_gateway.services.proxy_service import ProxyService
+
+TOOL_ID = "test_server_search_tool"
+
+
+@pytest.fixture
+def cached_proxy(mock_client_manager, tool_repository, sample_tools):
+    """Proxy service caching the sample search tool, with a small cache"""
+    tool_repository.add_tool_sync(sample_tools[0])
+    mock_client_manager.execute_tool.side_effect = lambda server, tool, args: {"query": args.get("q")}
+    return ProxyService(
+        mock_client_manager,
+        tool_repository,
+        cacheable_tools={TOOL_ID},
+        result_cache_size=2,
+        result_cache_ttl=10.0,
+    )
+
+
+class TestResultCache:
+    """Test caching of tool execution results"""
+
+    async def test_repeated_call_served_from_cache(self, cached_proxy, mock_client_manager):
+        """Test identical calls only reach the server once"""
+        first = await cached_proxy.execute_tool(TOOL_ID, {"q": "a"})
+        second = await cached_proxy.execute_tool(TOOL_ID, {"q": "a"})
+
+        assert first == second == {"query": "a"}
+        assert mock_client_manager.execute_tool.await_count == 1
+
+    async def test_argument_order_does_not_matter(self, cached_proxy, mock_client_manager):
+        """Test arguments are compared by content, not key order"""
+        await cached_proxy.execute_tool(TOOL_ID, {"q": "a", "limit": 1})
+        await cached_proxy.execute_tool(TOOL_ID, {"limit": 1, "q": "a"})
+
+        assert mock_client_manager.execute_tool.await_count == 1
+
+    async def test_entries_expire_after_ttl(self, cached_proxy, mock_client_manager):
+        """Test a cached result is not reused once its TTL has passed"""
+        with patch("hive_mcp_gateway.services.proxy_service.time.monotonic", return_value=100.0):
+            await cached_proxy.execute_tool(TOOL_ID, {"q": "a"})
+        with patch("hive_mcp_gateway.services.proxy_service.time.monotonic", return_value=105.0):
+            await cached_proxy.execute_tool(TOOL_ID, {"q": "a"})
+        assert mock_client_manager.execute_tool.await_count == 1
+
+        with patch("hive_mcp_gateway.services.proxy_service.time.monotonic", return_value=111.0):
+            await cached_proxy.execute_tool(TOOL_ID, {"q": "a"})
+        assert mock_client_manager.execute_tool.await_count == 2
+
+    async def test_least_recently_used_is_evicted(self, cached_proxy, mock_client_manager):
+        """Test the cache drops the least recently used entry at capacity"""
+        await cached_proxy.execute_tool(TOOL_ID, {"q": "a"})
+        await cached_proxy.execute_tool(TOOL_ID, {"q": "b"})
+        # Touch "a" so "b" becomes the oldest entry
+        await cached_proxy.execute_tool(TOOL_ID, {"q": "a"})
+        await cached_proxy.execute_tool(TOOL_ID, {"q": "c"})
+        assert mock_client_manager.execute_tool.await_count == 3
+
+        await cached_proxy.execute_tool(TOOL_ID, {"q": "a"})
+        assert mock_client_manager.execute_tool.await_count == 3
+        await cached_proxy.execute_tool(TOOL_ID, {"q": "b"})
+        assert mock_client_manager.execute_tool.await_count == 4
+
+    @pytest.mark.parametrize("action", ["provision_tool", "unprovision_tool"])
+    async def test_provisioning_invalidates(self, cached_proxy, mock_client_manager, action):
+        """Test (un)provisioning a tool drops its cached results"""
+        await cached_proxy.execute_tool(TOOL_ID, {"q": "a"})
+        getattr(cached_proxy, action)(TOOL_ID)
+        await cached_proxy.execute_tool(TOOL_ID, {"q": "a"})
+
+        assert mock_client_manager.execute_tool.await_count == 2
+
+    async def test_uncacheable_tool_always_executes(self, proxy_service, tool_repository,
+                                                     sample_tools, mock_client_manager):
+        """Test tools outside cacheable_tools are never cached"""
+        tool_repository.add_tool_sync(sample_tools[0])
+        mock_client_manager.execute_tool.return_value = {"ok": True}
+
+        await proxy_service.execute_tool(TOOL_ID, {"q": "a"})
+        await proxy_service.execute_tool(TOOL_ID, {"q": "a"})
+
+        assert mock_client_manager.execute_tool.await_count == 2
@@ -0,0 +1,40 @@
+"""
+Piped Stderr Tests
+
+Tests how UniversalMCPClient drains stderr for servers run with StderrMode.PIPE:
+- Output is read until EOF so the child never blocks on a full pipe
+- Only the last lines are kept
+- Servers without piped stderr report an empty tail
+"""
+
+import asyncio
+
+from hive_mcp_gateway.services.universal_mcp_client import UniversalMCPClient, _STDERR_TAIL_LINES
+
+
+class TestStderrTail:
+    """Test the bounded stderr tail"""
+
+    async def test_keeps_last_lines(self):
+        """Test more output than the pipe buffer is drained and trimmed to the tail"""
+        client = UniversalMCPClient()
+        errlog = client._open_stderr_pipe("noisy")
+        task = client._stderr_tasks["noisy"]
+
+        def spam():
+            with errlog:
+                for i in range(5000):
+                    errlog.write(f"line {i} {'x' * 40}\n")
+
+        # Writing from a thread would block forever if nothing drained the pipe
+        await asyncio.wait_for(asyncio.to_thread(spam), timeout=10)
+        await asyncio.wait_for(task, timeout=5)
+
+        tail = client.get_stderr_tail("noisy")
+        assert len(tail) == _STDERR_TAIL_LINES
+        assert tail[-1].startswith("line 4999 ")
+        assert "noisy" not in client._stderr_tasks
+
+    def test_unknown_server_has_empty_tail(self):
+        """Test a server without piped stderr reports no lines"""
+        assert UniversalMCPClient().get_stderr_tail("missing") == []
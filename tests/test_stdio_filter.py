@@ -0,0 +1,114 @@
+"""
+STDIO Stream Filter Tests
+
+Tests the banner filter that sits between a STDIO server and the MCP client:
+- Banner text before, between and after JSON-RPC messages is dropped
+- Messages split across chunks are reassembled
+- Braces, quotes and escapes inside JSON strings don't confuse the scanner
+- Unbalanced braces in banners don't swallow the messages that follow
+"""
+
+import json
+
+import pytest
+
+from hive_mcp_gateway.services.stdio_filter import StdioStreamFilter
+
+
+def _messages(output):
+    """Split filter output back into the JSON objects it contains."""
+    decoder = json.JSONDecoder()
+    text = output.decode("utf-8") if output else ""
+    found, pos = [], 0
+    while pos < len(text):
+        obj, pos = decoder.raw_decode(text, pos)
+        found.append(obj)
+    return found
+
+
+def _feed(chunks):
+    stream_filter = StdioStreamFilter("test")
+    output = b"".join(stream_filter._filter_chunk(chunk) or b"" for chunk in chunks)
+    return _messages(output)
+
+
+class TestBannerRemoval:
+    """Test that non-JSON output is dropped around messages"""
+
+    def test_banner_before_message(self):
+        """Test a startup banner is stripped from the first message"""
+        message = {"jsonrpc": "2.0", "id": 1, "result": {}}
+        chunks = [b"Welcome to FastMCP v2!\n" + json.dumps(message).encode() + b"\n"]
+        assert _feed(chunks) == [message]
+
+    def test_banner_between_messages(self):
+        """Test output printed between two messages is dropped"""
+        first = {"jsonrpc": "2.0", "id": 1, "result": {}}
+        second = {"jsonrpc": "2.0", "id": 2, "result": {"ok": True}}
+        data = json.dumps(first).encode() + b"\nWARNING: something\n" + json.dumps(second).encode()
+        assert _feed([data]) == [first, second]
+
+    def test_pure_banner_produces_nothing(self):
+        """Test a chunk without any JSON yields no output"""
+        stream_filter = StdioStreamFilter("test")
+        assert stream_filter._filter_chunk(b"Starting server...\n") is None
+
+    def test_unbalanced_brace_in_banner(self):
+        """Test a stray brace in banner text doesn't swallow later messages"""
+        message = {"jsonrpc": "2.0", "id": 7, "result": {}}
+        chunks = [b"Config loaded {debug mode\n", json.dumps(message).encode()]
+        assert _feed(chunks) == [message]
+
+    def test_accepts_str_chunks(self):
+        """Test text chunks are filtered the same as bytes"""
+        message = {"jsonrpc": "2.0", "id": 1, "result": {}}
+        assert _feed(["banner " + json.dumps(message)]) == [message]
+
+
+class TestChunkBoundaries:
+    """Test messages split across reads are reassembled"""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 16])
+    def test_message_split_into_fixed_chunks(self, size):
+        """Test a message survives being split at every possible boundary"""
+        message = {
+            "jsonrpc": "2.0",
+            "id": 3,
+            "result": {"text": 'brace { and } quote " backslash \\ end', "nested": {"a": [1, {"b": 2}]}},
+        }
+        data = b"banner {not json\n" + json.dumps(message).encode() + b"\ntrailing"
+        chunks = [data[i:i + size] for i in range(0, len(data), size)]
+        assert _feed(chunks) == [message]
+
+    def test_split_after_opening_brace(self):
+        """Test a chunk ending right after '{' is carried into the next chunk"""
+        message = {"jsonrpc": "2.0", "id": 4, "result": {}}
+        data = json.dumps(message).encode()
+        assert _feed([b"log line {", data[1:]]) == [message]
+
+    def test_split_on_escape(self):
+        """Test a chunk ending on a backslash inside a string"""
+        message = {"jsonrpc": "2.0", "id": 5, "result": {"path": 'C:\\dir\\"quoted"'}}
+        data = json.dumps(message).encode()
+        cut = data.index(b"\\") + 1
+        assert _feed([data[:cut], data[cut:]]) == [message]
+
+
+class TestStringContents:
+    """Test JSON string contents don't affect brace matching"""
+
+    def test_braces_inside_strings(self):
+        """Test unbalanced braces inside a string value"""
+        message = {"jsonrpc": "2.0", "id": 6, "result": {"code": "function f() { if (x) {"}}
+        assert _feed([json.dumps(message).encode()]) == [message]
+
+    def test_escaped_quotes_inside_strings(self):
+        """Test escaped quotes don't end the string early"""
+        message = {"jsonrpc": "2.0", "id": 8, "result": {"text": 'say "}" loudly'}}
+        assert _feed([json.dumps(message).encode()]) == [message]
+
+    def test_invalid_object_is_dropped(self):
+        """Test a balanced but invalid object is filtered out"""
+        message = {"jsonrpc": "2.0", "id": 9, "result": {}}
+        data = b'{"not": json at all}\n' + json.dumps(message).encode()
+        assert _feed([data]) == [message]